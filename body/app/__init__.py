@@ -1,5 +1,7 @@
 from flask import Flask, g, request
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.exceptions import HTTPException
+from pathlib import Path
 from time import perf_counter
 from .db import init_db
 from .datetime_utils import format_known_datetime
@@ -22,9 +24,19 @@ PLAIN_TEXT_URL_RE = re.compile(
 )
 
 
-def create_app():
+def create_app(test_config=None):
     """Create and configure the Flask application."""
     app = Flask(__name__, instance_relative_config=True)
+    if test_config:
+        app.config.from_mapping(test_config)
+    # Template auto-reload already follows debug mode, so production renders never
+    # stat template files. Compiled template bytecode is kept under instance/ so a
+    # fresh worker process skips re-parsing the mailbox templates on first render.
+    # Test apps skip it so the suite does not write compiled templates there.
+    if not app.testing:
+        jinja_cache_dir = Path(app.instance_path) / "jinja_cache"
+        jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(jinja_cache_dir))
 
     # Startup work is front-loaded here so failures are visible immediately and
     # the rest of the request lifecycle can assume the basics are ready.
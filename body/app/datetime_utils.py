@@ -1,6 +1,7 @@
 """Shared helpers for the loose datetime strings stored in the mailbox DB."""
 
 from datetime import datetime
+from functools import lru_cache
 
 
 # Old rows mix date-only values with second-level timestamps, so the parser
@@ -10,14 +11,44 @@ KNOWN_EMAIL_DATETIME_FORMATS = (
     "%Y-%m-%d %H:%M",
     "%Y-%m-%d",
 )
+DEFAULT_DISPLAY_FORMAT = "%d/%m/%Y %H:%M"
+# Mailbox pages repeat the same timestamps on every render/poll, so keep a bounded memo.
+DATETIME_CACHE_SIZE = 4096
 
 
-def parse_known_datetime(value):
-    """Parse one of the mailbox datetime formats into a ``datetime`` object."""
-    text = str(value or "").strip()
-    if not text:
+def _parse_fixed_width(text):
+    """Parse zero-padded ``YYYY-MM-DD[ HH:MM[:SS]]`` text by slicing, or return None."""
+    length = len(text)
+    if length not in (10, 16, 19) or text[4] != "-" or text[7] != "-":
+        return None
+    digits = text[0:4] + text[5:7] + text[8:10]
+    if length > 10:
+        if text[10] != " " or text[13] != ":" or (length == 19 and text[16] != ":"):
+            return None
+        digits += text[11:13] + text[14:16] + text[17:19]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return datetime(
+            int(digits[0:4]),
+            int(digits[4:6]),
+            int(digits[6:8]),
+            int(digits[8:10] or 0),
+            int(digits[10:12] or 0),
+            int(digits[12:14] or 0),
+        )
+    except ValueError:
         return None
 
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _parse_known_datetime_text(text):
+    """Parse stripped datetime text, trying the slicing fast path before strptime."""
+    parsed = _parse_fixed_width(text)
+    if parsed is not None:
+        return parsed
+
+    # Unpadded legacy values still go through strptime so accepted inputs stay unchanged.
     for fmt in KNOWN_EMAIL_DATETIME_FORMATS:
         try:
             return datetime.strptime(text, fmt)
@@ -26,12 +57,30 @@ def parse_known_datetime(value):
     return None
 
 
-def format_known_datetime(value, output_format="%d/%m/%Y %H:%M"):
-    """Format a mailbox datetime string, or fall back to the original text."""
-    if value is None:
-        return ""
+def parse_known_datetime(value):
+    """Parse one of the mailbox datetime formats into a ``datetime`` object."""
+    text = str(value or "").strip()
+    if not text:
+        return None
+    return _parse_known_datetime_text(text)
+
 
-    parsed = parse_known_datetime(value)
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _format_known_datetime_text(text, output_format):
+    """Format stripped datetime text, using an f-string for the default display format."""
+    parsed = _parse_known_datetime_text(text) if text else None
     if parsed is None:
-        return str(value).strip()
+        return text
+    if output_format == DEFAULT_DISPLAY_FORMAT:
+        return (
+            f"{parsed.day:02}/{parsed.month:02}/{parsed.year} "
+            f"{parsed.hour:02}:{parsed.minute:02}"
+        )
     return parsed.strftime(output_format)
+
+
+def format_known_datetime(value, output_format=DEFAULT_DISPLAY_FORMAT):
+    """Format a mailbox datetime string, or fall back to the original text."""
+    if value is None:
+        return ""
+    return _format_known_datetime_text(str(value).strip(), output_format)
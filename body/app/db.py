@@ -1,8 +1,15 @@
 """SQLite persistence for mailbox data, settings, and local draft state."""
 
+import atexit
+import os
+import queue
+import re
 import sqlite3
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
 from pathlib import Path
 from .debug_logger import log_event, log_exception
 from .email_content import (
@@ -18,6 +25,18 @@ APP_ROOT = Path(__file__).resolve().parent.parent
 DB_DEFAULT = str(APP_ROOT / "instance" / "app.sqlite")
 LOCAL_USER_EMAIL = "you@example.com"
 SQLITE_BUSY_TIMEOUT_MS = 30000
+# Bump whenever _apply_schema_migrations gains a step so existing files re-run it once.
+SCHEMA_VERSION = 2
+SQLITE_CACHE_SIZE_KIB = 65536
+SQLITE_MMAP_SIZE_BYTES = 268435456
+SQLITE_PAGE_SIZE_BYTES = 8192
+SQLITE_POOL_MAX_IDLE = 4
+# WAL allows many concurrent readers but only one writer, so size the pools to match.
+SQLITE_READ_POOL_MAX_IDLE = os.cpu_count() or SQLITE_POOL_MAX_IDLE
+SQLITE_WRITE_POOL_MAX_IDLE = 1
+READ_CACHE_MAX_ENTRIES = 256
+# Fixed SQL constants plus per-shape filter/IN-list text easily exceed sqlite3's default of 128.
+SQLITE_CACHED_STATEMENTS = 256
 ALLOWED_TYPES = {
     "response-needed",
     "read-only",
@@ -33,6 +52,7 @@ AI_CATEGORIES = {
 }
 USER_DISPLAY_NAME_SETTING_KEY = "user_display_name"
 SETTING_VALUE_MAX_CHARS = 80
+_ADDRESS_SPLIT_PATTERN = re.compile(r"\s*[,;]\s*")
 
 EMAIL_SELECT_SQL = """
 SELECT
@@ -42,24 +62,8 @@ SELECT
     m.thread_id,
     m.title,
     m.sender,
-    (
-        SELECT group_concat(r.address, ', ')
-        FROM (
-            SELECT er.address
-            FROM email_recipients er
-            WHERE er.email_id = m.id AND er.recipient_type = 'to'
-            ORDER BY er.id ASC
-        ) AS r
-    ) AS recipients,
-    (
-        SELECT group_concat(r.address, ', ')
-        FROM (
-            SELECT er.address
-            FROM email_recipients er
-            WHERE er.email_id = m.id AND er.recipient_type = 'cc'
-            ORDER BY er.id ASC
-        ) AS r
-    ) AS cc,
+    m.recipients_to,
+    m.recipients_cc,
     m.body,
     m.body_html,
     m.type,
@@ -75,6 +79,32 @@ SELECT
 FROM email_messages m
 """
 
+# Keep each lookup's SQL text fixed so pooled connections hit sqlite3's statement cache.
+EMAIL_BY_ID_SQL = f"""
+{EMAIL_SELECT_SQL}
+WHERE m.id = ?
+"""
+
+EMAIL_BY_PROVIDER_DRAFT_ID_SQL = f"""
+{EMAIL_SELECT_SQL}
+WHERE m.provider_draft_id = ?
+"""
+
+EMAIL_THREAD_SQL = f"""
+{EMAIL_SELECT_SQL}
+WHERE m.thread_id = ?
+ORDER BY m.received_at ASC, m.id ASC
+"""
+
+# Inbox detail pages only show the thread's live mailbox rows, never sent/draft/archived ones.
+EMAIL_THREAD_MAIN_SQL = f"""
+{EMAIL_SELECT_SQL}
+WHERE m.thread_id = ?
+  AND m.type NOT IN ('sent', 'draft')
+  AND m.is_archived = 0
+ORDER BY m.received_at ASC, m.id ASC
+"""
+
 MAILBOX_LIST_SELECT_SQL = """
 SELECT
     m.id,
@@ -96,6 +126,45 @@ MAILBOX_SORT_SQL = {
     "read_first": "m.is_read DESC, m.received_at DESC, m.id DESC",
 }
 
+# Bulk actions only need routing/state columns, so they never pull bodies or recipients.
+EMAIL_STATE_SELECT_SQL = """
+SELECT
+    m.id,
+    m.external_id,
+    m.provider_draft_id,
+    m.type,
+    m.is_read,
+    m.is_archived
+FROM email_messages m
+"""
+
+# Fills empty denormalized TO/CC columns from recipient rows, keeping insertion (id) order.
+RECIPIENT_COLUMNS_BACKFILL_SQL = """
+UPDATE email_messages
+SET
+    recipients_to = (
+        SELECT group_concat(address, ', ')
+        FROM (
+            SELECT address
+            FROM email_recipients
+            WHERE email_id = email_messages.id AND recipient_type = 'to'
+            ORDER BY id
+        )
+    ),
+    recipients_cc = (
+        SELECT group_concat(address, ', ')
+        FROM (
+            SELECT address
+            FROM email_recipients
+            WHERE email_id = email_messages.id AND recipient_type = 'cc'
+            ORDER BY id
+        )
+    )
+WHERE recipients_to IS NULL
+  AND recipients_cc IS NULL
+  AND EXISTS (SELECT 1 FROM email_recipients WHERE email_id = email_messages.id)
+"""
+
 PROVIDER_ROW_SELECT_FIELDS = """
 id,
 body,
@@ -112,31 +181,261 @@ ai_confidence
 """
 
 
-@contextmanager
-def db_session(db_path):
-    """Open one SQLite transaction scope and cleanly commit or roll it back."""
-    # One connection per context call keeps transaction boundaries explicit.
-    conn = sqlite3.connect(db_path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000)
+class _ConnectionPool:
+    """Idle SQLite connections kept per database path so sessions can reuse them."""
+
+    def __init__(self, max_idle=SQLITE_POOL_MAX_IDLE, readonly=False):
+        self.max_idle = max_idle
+        self.readonly = readonly
+        self.lock = threading.Lock()
+        self.idle = {}
+
+    def _queue_for(self, key):
+        with self.lock:
+            idle = self.idle.get(key)
+            if idle is None:
+                idle = queue.LifoQueue(maxsize=self.max_idle)
+                self.idle[key] = idle
+            return idle
+
+    def acquire(self, db_path):
+        """Return a warm connection for this path, opening a new one when none are idle."""
+        key = str(db_path)
+        try:
+            return self._queue_for(key).get_nowait()
+        except queue.Empty:
+            return _make_conn(key, readonly=self.readonly)
+
+    def release(self, db_path, conn):
+        """Hand a connection back, closing it when it is mid-transaction or the pool is full."""
+        if conn.in_transaction:
+            conn.close()
+            return
+        try:
+            self._queue_for(str(db_path)).put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close_all(self, db_path=None):
+        """Close idle connections for one path (or every path)."""
+        with self.lock:
+            if db_path is None:
+                queues = list(self.idle.values())
+                self.idle.clear()
+            else:
+                idle = self.idle.pop(str(db_path), None)
+                queues = [idle] if idle is not None else []
+        for idle in queues:
+            while True:
+                try:
+                    idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+def _make_conn(db_path, readonly=False):
+    """Open one SQLite connection and apply the per-connection PRAGMAs once."""
+    # Pooled connections hop between request/sync threads, but only one session uses each at a time.
+    conn = sqlite3.connect(
+        db_path,
+        timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+        check_same_thread=False,
+        cached_statements=SQLITE_CACHED_STATEMENTS,
+    )
     conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS};")
+    conn.execute("PRAGMA foreign_keys = ON;")
+    # journal_mode=WAL is persisted in the file by init_db; these settings are per connection.
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_SIZE_KIB};")
+    conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE_BYTES};")
+    if readonly:
+        # Reader connections refuse writes outright, so a stray UPDATE cannot slip past db_session.
+        conn.execute("PRAGMA query_only = ON;")
+    return conn
+
+
+class _ReadCache:
+    """Bounded LRU of read-helper results, dropped wholesale whenever a session writes.
+
+    Only writes through this process's db_session invalidate it, so it assumes this process
+    is the database's sole writer; changes made by another process are not seen until then.
+    """
+
+    def __init__(self, max_entries=READ_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.generation = 0
+
+    def get(self, key):
+        """Return ``(hit, value)`` and mark a hit as most recently used."""
+        with self.lock:
+            if key not in self.entries:
+                return False, None
+            self.entries.move_to_end(key)
+            return True, self.entries[key]
+
+    def put(self, key, value, generation):
+        """Store a result unless a write landed while it was being read."""
+        with self.lock:
+            if generation != self.generation:
+                return
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self):
+        """Forget every cached result; any in-flight read from before now is not stored."""
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+
+
+CONNECTION_POOL = _ConnectionPool(max_idle=SQLITE_WRITE_POOL_MAX_IDLE)
+READ_CONNECTION_POOL = _ConnectionPool(max_idle=SQLITE_READ_POOL_MAX_IDLE, readonly=True)
+READ_CACHE = _ReadCache()
+_WRITE_LOCKS = {}
+_WRITE_LOCKS_GUARD = threading.Lock()
+# Connection held by each thread's open write session, keyed by path, so nested sessions join it.
+_ACTIVE_WRITE_SESSIONS = threading.local()
+
+
+def _write_lock(db_path):
+    """Return the per-path lock that lets one write session run at a time in this process."""
+    key = str(db_path)
+    with _WRITE_LOCKS_GUARD:
+        lock = _WRITE_LOCKS.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _WRITE_LOCKS[key] = lock
+        return lock
+
+
+def _freeze_cache_arg(value):
+    """Turn list/set arguments into hashable equivalents for cache keys."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_cache_arg(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+def _copy_cached_result(value):
+    """Hand out fresh dicts so callers can mutate results without touching the cache."""
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _cached_read(func):
+    """Serve repeated identical reads from READ_CACHE until the next committed write."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (
+                func.__name__,
+                _freeze_cache_arg(args),
+                tuple(sorted((name, _freeze_cache_arg(value)) for name, value in kwargs.items())),
+            )
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        hit, cached = READ_CACHE.get(key)
+        if hit:
+            return _copy_cached_result(cached)
+        generation = READ_CACHE.generation
+        result = func(*args, **kwargs)
+        READ_CACHE.put(key, _copy_cached_result(result), generation)
+        return result
+
+    return wrapper
+
+
+def close_db_connections(db_path=None):
+    """Close pooled connections, e.g. before deleting or replacing a database file."""
+    CONNECTION_POOL.close_all(db_path)
+    READ_CONNECTION_POOL.close_all(db_path)
+    READ_CACHE.invalidate()
+
+
+# Closing the last connection lets SQLite checkpoint the WAL and drop the -wal/-shm files on exit.
+atexit.register(close_db_connections)
+
+
+@contextmanager
+def read_session(db_path):
+    """Borrow a query-only connection for SELECTs; there is nothing to commit."""
+    # WAL readers never block the writer, so read helpers skip db_session's commit/rollback cycle.
+    conn = READ_CONNECTION_POOL.acquire(db_path)
     try:
-        conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS};")
-        conn.execute("PRAGMA foreign_keys = ON;")
         yield conn
-        # Commit once per session so callers can perform multi-statement updates atomically.
-        conn.commit()
     except sqlite3.Error as e:
-        conn.rollback()
         log_exception(
             action_type="database",
-            action="db_session",
+            action="read_session",
             error=e,
             component="sqlite",
-            details="SQLite operation failed.",
+            details="SQLite read failed.",
             db_path=db_path,
         )
         raise
     finally:
-        conn.close()
+        READ_CONNECTION_POOL.release(db_path, conn)
+
+
+def _tuple_cursor(conn):
+    """Return a cursor yielding plain tuples for converters that unpack rows positionally."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+
+@contextmanager
+def db_session(db_path):
+    """Open one SQLite transaction scope and cleanly commit or roll it back."""
+    # Writers queue on a Python lock instead of spinning in SQLite's busy handler; readers
+    # use read_session and never wait here.
+    key = str(db_path)
+    active = getattr(_ACTIVE_WRITE_SESSIONS, "conns", None)
+    if active is None:
+        active = _ACTIVE_WRITE_SESSIONS.conns = {}
+    if key in active:
+        # A second pooled connection would wait out busy_timeout on the outer transaction's
+        # lock, so a nested session shares it and leaves commit/rollback to the outer one.
+        yield active[key]
+        return
+    with _write_lock(db_path):
+        # Connections are pooled per path; the session itself still owns one explicit transaction.
+        conn = CONNECTION_POOL.acquire(db_path)
+        changes_before = conn.total_changes
+        active[key] = conn
+        try:
+            yield conn
+            # Commit once per session so callers can perform multi-statement updates atomically.
+            conn.commit()
+            if conn.total_changes != changes_before:
+                READ_CACHE.invalidate()
+        except sqlite3.Error as e:
+            conn.rollback()
+            log_exception(
+                action_type="database",
+                action="db_session",
+                error=e,
+                component="sqlite",
+                details="SQLite operation failed.",
+                db_path=db_path,
+            )
+            raise
+        finally:
+            active.pop(key, None)
+            CONNECTION_POOL.release(db_path, conn)
 
 
 def init_db(db_path=DB_DEFAULT):
@@ -147,12 +446,23 @@ def init_db(db_path=DB_DEFAULT):
 
     db_path = Path(db_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
+    is_new_file = not db_path.exists() or db_path.stat().st_size == 0
 
     with db_session(db_path) as conn:
+        if is_new_file:
+            # Page layout and vacuum mode only take effect before the first table exists.
+            conn.execute(f"PRAGMA page_size = {SQLITE_PAGE_SIZE_BYTES};")
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+        # WAL is persistent, so later connections inherit it without re-issuing the PRAGMA.
         conn.execute("PRAGMA journal_mode = WAL;")
-        conn.execute("PRAGMA synchronous = NORMAL;")
-        conn.executescript(schema_path.read_text(encoding="utf-8"))
+        # executescript autocommits each statement; one explicit transaction makes schema/seed
+        # setup a single fsync and leaves nothing half-applied if a statement fails.
+        conn.executescript(f"BEGIN;\n{schema_path.read_text(encoding='utf-8')}\nCOMMIT;")
         _apply_schema_migrations(conn)
+        # Seed SQL and pre-column databases only carry email_recipients rows.
+        conn.execute(RECIPIENT_COLUMNS_BACKFILL_SQL)
+        _SEARCH_INDEX_READY[str(db_path)] = _ensure_search_index(conn)
+        _refresh_planner_stats(conn)
     log_event(
         action_type="database",
         action="init_schema",
@@ -164,6 +474,10 @@ def init_db(db_path=DB_DEFAULT):
 
 def _apply_schema_migrations(conn):
     """Bring older databases forward without forcing a manual reset."""
+    # user_version is an O(1) header read, so up-to-date files skip the schema inspection below.
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+
     # Snapshot current schema so we can decide whether rebuild/alter is needed.
     columns = {
         row["name"]
@@ -222,6 +536,10 @@ def _apply_schema_migrations(conn):
               CHECK (is_archived IN (0,1))
             """
         )
+    if "recipients_to" not in columns_after:
+        conn.execute("ALTER TABLE email_messages ADD COLUMN recipients_to TEXT")
+    if "recipients_cc" not in columns_after:
+        conn.execute("ALTER TABLE email_messages ADD COLUMN recipients_cc TEXT")
     _ensure_settings_table(conn)
 
     # Keep read-heavy mailbox queries fast with explicit supporting indexes.
@@ -256,6 +574,60 @@ def _apply_schema_migrations(conn):
         ON email_recipients(email_id, recipient_type, id)
         """
     )
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+
+
+def _refresh_planner_stats(conn):
+    """Collect planner statistics once, then let PRAGMA optimize keep them current."""
+    # Mailbox list shapes always filter on is_archived (and optionally type), so the indexes above
+    # already serve their ORDER BY ranges; planner statistics let SQLite pick them reliably.
+    has_planner_stats = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+    ).fetchone()
+    conn.execute("PRAGMA optimize;" if has_planner_stats else "ANALYZE;")
+
+
+def _ensure_search_index(conn):
+    """Create the FTS5 search index and its sync triggers; return False when FTS5 is unavailable."""
+    existing = {
+        row["name"]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE 'email_search_fts%'"
+        ).fetchall()
+    }
+    # Table rebuilds drop the triggers, so any missing piece means the index may be stale.
+    if SEARCH_INDEX_OBJECTS.issubset(existing):
+        return True
+    try:
+        # The virtual table is the first statement, so builds without FTS5 fail before any trigger.
+        conn.executescript(SEARCH_INDEX_SQL)
+    except sqlite3.OperationalError as e:
+        log_exception(
+            action_type="database",
+            action="init_search_index",
+            error=e,
+            component="sqlite",
+            details="FTS5 unavailable; mailbox search falls back to LIKE scans.",
+        )
+        return False
+    conn.execute("INSERT INTO email_search_fts(email_search_fts) VALUES ('rebuild')")
+    return True
+
+
+def _search_index_ready(db_path):
+    """Return whether the FTS5 search index exists for this database path."""
+    key = str(db_path)
+    ready = _SEARCH_INDEX_READY.get(key)
+    if ready is None:
+        with read_session(db_path) as conn:
+            ready = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='email_search_fts'"
+                ).fetchone()
+                is not None
+            )
+        _SEARCH_INDEX_READY[key] = ready
+    return ready
 
 
 def _ensure_settings_table(conn):
@@ -271,6 +643,11 @@ def _ensure_settings_table(conn):
     )
 
 
+def _utc_timestamp():
+    """Return the current UTC time in the same text shape SQLite's CURRENT_TIMESTAMP uses."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
 def _normalize_setting_value(value, max_chars=SETTING_VALUE_MAX_CHARS):
     """Normalize short app-setting text values before storage."""
     if value is None:
@@ -297,6 +674,8 @@ def _rebuild_email_tables(conn, existing_columns):
         "ai_confidence" if "ai_confidence" in existing_columns else "NULL"
     )
     is_archived_expr = "is_archived" if "is_archived" in existing_columns else "0"
+    recipients_to_expr = "recipients_to" if "recipients_to" in existing_columns else "NULL"
+    recipients_cc_expr = "recipients_cc" if "recipients_cc" in existing_columns else "NULL"
 
     # Temporarily disable FK checks while tables are renamed/recreated in place.
     conn.execute("PRAGMA foreign_keys = OFF;")
@@ -312,6 +691,8 @@ def _rebuild_email_tables(conn, existing_columns):
           thread_id TEXT,
           title TEXT NOT NULL,
           sender TEXT NOT NULL,
+          recipients_to TEXT,
+          recipients_cc TEXT,
           body TEXT,
           body_html TEXT,
           type TEXT NOT NULL DEFAULT 'read-only'
@@ -338,9 +719,9 @@ def _rebuild_email_tables(conn, existing_columns):
     conn.execute(
         f"""
         INSERT INTO email_messages (
-            id, external_id, provider_draft_id, thread_id, title, sender, body, body_html,
-            type, priority, is_read, received_at, summary, draft, is_archived,
-            ai_category, ai_needs_response, ai_confidence
+            id, external_id, provider_draft_id, thread_id, title, sender,
+            recipients_to, recipients_cc, body, body_html, type, priority, is_read,
+            received_at, summary, draft, is_archived, ai_category, ai_needs_response, ai_confidence
         )
         SELECT
             id,
@@ -349,6 +730,8 @@ def _rebuild_email_tables(conn, existing_columns):
             thread_id,
             title,
             sender,
+            {recipients_to_expr},
+            {recipients_cc_expr},
             body,
             {body_html_expr},
             CASE
@@ -398,64 +781,91 @@ def _rebuild_email_tables(conn, existing_columns):
 
 
 def _row_to_dict(row):
-    """Row recipient dict.
-    """
-    data = dict(row)
+    """Convert one EMAIL_SELECT_SQL tuple row into the repaired dict used by views and AI code."""
+    # Read helpers use tuple cursors, so unpack in EMAIL_SELECT_SQL column order.
+    (
+        email_id,
+        external_id,
+        provider_draft_id,
+        thread_id,
+        title,
+        sender,
+        recipients,
+        cc,
+        body,
+        body_html,
+        email_type,
+        priority,
+        is_read,
+        received_at,
+        summary,
+        draft,
+        is_archived,
+        ai_category,
+        ai_needs_response,
+        ai_confidence,
+    ) = row
     repaired_body_html = None
-    if data.get("body_html") is not None:
-        repaired_body_html = repair_html_content(data.get("body_html") or "")
+    if body_html is not None:
+        repaired_body_html = repair_html_content(body_html or "")
         if contains_common_mojibake(repaired_body_html):
             repaired_body_html = None
-        data["body_html"] = repaired_body_html or None
-    if "body" in data:
-        data["body"] = repair_body_text(data.get("body") or "", repaired_body_html)
-    if "title" in data and data["title"] is not None:
-        data["title"] = repair_header_text(data["title"])
-    if "sender" in data and data["sender"] is not None:
-        data["sender"] = repair_header_text(data["sender"])
-    if "recipients" in data and data["recipients"] is not None:
-        data["recipients"] = repair_header_text(data["recipients"])
-    if "cc" in data and data["cc"] is not None:
-        data["cc"] = repair_header_text(data["cc"])
-    if "draft" in data and data["draft"] is not None:
-        data["draft"] = normalize_outgoing_text(data["draft"])
     # Normalize SQLite scalar types (0/1/REAL) into Python values used by templates/API code.
-    if "is_read" in data:
-        data["is_read"] = bool(data["is_read"])
-    if "is_archived" in data:
-        data["is_archived"] = bool(data["is_archived"])
-    if "ai_needs_response" in data and data["ai_needs_response"] is not None:
-        data["ai_needs_response"] = bool(data["ai_needs_response"])
-    if "priority" in data and data["priority"] is not None:
-        data["priority"] = int(data["priority"])
-    if "ai_confidence" in data and data["ai_confidence"] is not None:
-        data["ai_confidence"] = float(data["ai_confidence"])
-    if "summary" in data and data["summary"] is not None:
-        data["summary"] = " ".join(repair_body_text(data["summary"], None).split()).strip()
-    if "title" not in data and "subject" in data:
-        data["title"] = data["subject"]
-    if "received_at" in data and "date" not in data:
-        data["date"] = data["received_at"]
-    return data
+    return {
+        "id": email_id,
+        "external_id": external_id,
+        "provider_draft_id": provider_draft_id,
+        "thread_id": thread_id,
+        "title": repair_header_text(title) if title is not None else None,
+        "sender": repair_header_text(sender) if sender is not None else None,
+        "recipients": repair_header_text(recipients) if recipients is not None else None,
+        "cc": repair_header_text(cc) if cc is not None else None,
+        "body": repair_body_text(body or "", repaired_body_html),
+        "body_html": (repaired_body_html or None) if body_html is not None else None,
+        "type": email_type,
+        # NOT NULL + CHECK (priority BETWEEN 1 AND 3) with INTEGER affinity: already an int.
+        "priority": priority,
+        "is_read": bool(is_read),
+        "received_at": received_at,
+        "summary": (
+            " ".join(repair_body_text(summary, None).split()).strip()
+            if summary is not None
+            else None
+        ),
+        "draft": normalize_outgoing_text(draft) if draft is not None else None,
+        "is_archived": bool(is_archived),
+        "ai_category": ai_category,
+        "ai_needs_response": bool(ai_needs_response) if ai_needs_response is not None else None,
+        "ai_confidence": float(ai_confidence) if ai_confidence is not None else None,
+        "date": received_at,
+    }
+
+
+def _mailbox_row_to_dict(row):
+    """Convert one MAILBOX_LIST_SELECT_SQL tuple row without the generic per-key checks."""
+    email_id, title, email_type, priority, is_read, received_at, is_archived = row
+    return {
+        "id": email_id,
+        "title": repair_header_text(title) if title is not None else None,
+        "type": email_type,
+        "priority": priority,
+        "is_read": bool(is_read),
+        "received_at": received_at,
+        "is_archived": bool(is_archived),
+        "date": received_at,
+    }
 
 
 def _split_addresses(raw_value):
     """Split a comma/semicolon-delimited address field into unique entries."""
     if raw_value is None:
         return []
-    text = str(raw_value).replace(";", ",")
-    addresses = []
-    seen = set()
-    for chunk in text.split(","):
-        address = chunk.strip()
-        if not address:
-            continue
-        key = address.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        addresses.append(address)
-    return addresses
+    # Map lowercase keys to the first spelling seen so dedupe keeps the caller's casing/order.
+    unique = {}
+    for address in _ADDRESS_SPLIT_PATTERN.split(str(raw_value).strip()):
+        if address:
+            unique.setdefault(address.lower(), address)
+    return list(unique.values())
 
 
 def _escape_like_pattern(raw_value):
@@ -464,6 +874,98 @@ def _escape_like_pattern(raw_value):
     return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+# SQLite's LIKE already folds ASCII case (the same folding its lower() applies), so
+# columns are matched as stored instead of lower()-copying every body per query.
+MAILBOX_SEARCH_SQL = """
+(
+    m.title LIKE ? ESCAPE '\\'
+    OR m.sender LIKE ? ESCAPE '\\'
+    OR m.body LIKE ? ESCAPE '\\'
+    OR EXISTS (
+        SELECT 1
+        FROM email_recipients er
+        WHERE er.email_id = m.id
+          AND er.address LIKE ? ESCAPE '\\'
+    )
+)
+"""
+
+
+# Trigram FTS5 keeps the substring semantics of the LIKE search above but answers from an
+# index instead of scanning every body. External content keeps one copy of the text.
+SEARCH_INDEX_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS email_search_fts USING fts5(
+    title, sender, body, recipients_to, recipients_cc,
+    content='email_messages', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS email_search_fts_ai AFTER INSERT ON email_messages BEGIN
+    INSERT INTO email_search_fts(rowid, title, sender, body, recipients_to, recipients_cc)
+    VALUES (new.id, new.title, new.sender, new.body, new.recipients_to, new.recipients_cc);
+END;
+CREATE TRIGGER IF NOT EXISTS email_search_fts_ad AFTER DELETE ON email_messages BEGIN
+    INSERT INTO email_search_fts(
+        email_search_fts, rowid, title, sender, body, recipients_to, recipients_cc
+    )
+    VALUES ('delete', old.id, old.title, old.sender, old.body, old.recipients_to, old.recipients_cc);
+END;
+-- Provider upserts rewrite every column, so only reindex rows whose searchable text changed.
+CREATE TRIGGER IF NOT EXISTS email_search_fts_au
+AFTER UPDATE OF title, sender, body, recipients_to, recipients_cc ON email_messages
+WHEN old.title IS NOT new.title
+  OR old.sender IS NOT new.sender
+  OR old.body IS NOT new.body
+  OR old.recipients_to IS NOT new.recipients_to
+  OR old.recipients_cc IS NOT new.recipients_cc
+BEGIN
+    INSERT INTO email_search_fts(
+        email_search_fts, rowid, title, sender, body, recipients_to, recipients_cc
+    )
+    VALUES ('delete', old.id, old.title, old.sender, old.body, old.recipients_to, old.recipients_cc);
+    INSERT INTO email_search_fts(rowid, title, sender, body, recipients_to, recipients_cc)
+    VALUES (new.id, new.title, new.sender, new.body, new.recipients_to, new.recipients_cc);
+END;
+"""
+
+SEARCH_INDEX_OBJECTS = frozenset(
+    {"email_search_fts", "email_search_fts_ai", "email_search_fts_ad", "email_search_fts_au"}
+)
+
+MAILBOX_FTS_SEARCH_SQL = (
+    "m.id IN (SELECT rowid FROM email_search_fts WHERE email_search_fts MATCH ?)"
+)
+
+# Trigrams need at least three characters; shorter queries keep the LIKE scan.
+FTS_MIN_QUERY_LENGTH = 3
+
+# Per-path FTS5 availability, recorded by init_db and probed lazily otherwise.
+_SEARCH_INDEX_READY = {}
+
+
+def _fts_phrase(query):
+    """Quote a search query as one FTS5 phrase so operators and punctuation match literally."""
+    return '"' + query.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=128)
+def _mailbox_filter_sql(
+    archived_only, include_archived, has_type, excluded_count, has_search, full_text=False
+):
+    """Assemble the WHERE text for one filter shape; only the bound values vary per request."""
+    where_clauses = []
+    if archived_only:
+        where_clauses.append("m.is_archived = 1")
+    elif not include_archived:
+        where_clauses.append("m.is_archived = 0")
+    if has_type:
+        where_clauses.append("m.type = ?")
+    if excluded_count:
+        placeholders = ", ".join("?" for _ in range(excluded_count))
+        where_clauses.append(f"m.type NOT IN ({placeholders})")
+    if has_search:
+        where_clauses.append(MAILBOX_FTS_SEARCH_SQL if full_text else MAILBOX_SEARCH_SQL)
+    return f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+
+
 def _build_mailbox_filter_clause(
     *,
     email_type=None,
@@ -471,47 +973,32 @@ def _build_mailbox_filter_clause(
     include_archived=False,
     archived_only=False,
     search_query=None,
+    db_path=DB_DEFAULT,
 ):
     """Build shared WHERE clauses for mailbox list/count queries."""
-    where_clauses = []
     params = []
-
-    if archived_only:
-        where_clauses.append("m.is_archived = 1")
-    elif not include_archived:
-        where_clauses.append("m.is_archived = 0")
-
     if email_type:
-        where_clauses.append("m.type = ?")
         params.append(email_type)
 
     excluded = sorted(set(exclude_types or []))
-    if excluded:
-        placeholders = ", ".join("?" for _ in excluded)
-        where_clauses.append(f"m.type NOT IN ({placeholders})")
-        params.extend(excluded)
+    params.extend(excluded)
 
     normalized_query = " ".join(str(search_query or "").split()).strip()
-    if normalized_query:
+    full_text = len(normalized_query) >= FTS_MIN_QUERY_LENGTH and _search_index_ready(db_path)
+    if full_text:
+        params.append(_fts_phrase(normalized_query))
+    elif normalized_query:
         like_value = f"%{_escape_like_pattern(normalized_query.lower())}%"
-        where_clauses.append(
-            """
-            (
-                lower(m.title) LIKE ? ESCAPE '\\'
-                OR lower(m.sender) LIKE ? ESCAPE '\\'
-                OR lower(coalesce(m.body, '')) LIKE ? ESCAPE '\\'
-                OR EXISTS (
-                    SELECT 1
-                    FROM email_recipients er
-                    WHERE er.email_id = m.id
-                      AND lower(er.address) LIKE ? ESCAPE '\\'
-                )
-            )
-            """
-        )
         params.extend([like_value, like_value, like_value, like_value])
 
-    clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    clause = _mailbox_filter_sql(
+        bool(archived_only),
+        bool(include_archived),
+        bool(email_type),
+        len(excluded),
+        bool(normalized_query),
+        full_text,
+    )
     return clause, params
 
 
@@ -520,25 +1007,53 @@ def _resolve_mailbox_sort_sql(sort_code):
     return MAILBOX_SORT_SQL.get(str(sort_code or "").strip(), MAILBOX_SORT_SQL["date_desc"])
 
 
-def _insert_recipients(conn, email_id, recipient_type, raw_value):
-    """Insert normalized TO/CC rows for one email."""
-    for address in _split_addresses(raw_value):
-        conn.execute(
+def _recipient_rows(email_id, recipient_type, addresses):
+    """Build normalized TO/CC insert rows for one email."""
+    return [(email_id, recipient_type, address) for address in addresses]
+
+
+def _joined_addresses(addresses):
+    """Join split addresses into the stored display text, or None when there are none."""
+    return ", ".join(addresses) if addresses else None
+
+
+def _replace_recipients(conn, email_id, recipients, cc):
+    """Rewrite the TO/CC rows so the DB mirrors the latest caller payload."""
+    _replace_recipients_many(conn, [(email_id, recipients, cc)])
+
+
+def _replace_recipients_many(conn, entries):
+    """Rewrite TO/CC data for several ``(email_id, recipients, cc)`` entries in batched statements."""
+    conn.executemany(
+        "DELETE FROM email_recipients WHERE email_id = ?",
+        [(email_id,) for email_id, _, _ in entries],
+    )
+    # One prepared statement for every address; TO rows go first so their ids sort ahead of CC.
+    rows = []
+    column_values = []
+    for email_id, recipients, cc in entries:
+        to_addresses = _split_addresses(recipients)
+        cc_addresses = _split_addresses(cc)
+        rows.extend(_recipient_rows(email_id, "to", to_addresses))
+        rows.extend(_recipient_rows(email_id, "cc", cc_addresses))
+        column_values.append(
+            (_joined_addresses(to_addresses), _joined_addresses(cc_addresses), email_id)
+        )
+    # Reads select these denormalized columns directly; email_recipients still backs search.
+    conn.executemany(
+        "UPDATE email_messages SET recipients_to = ?, recipients_cc = ? WHERE id = ?",
+        column_values,
+    )
+    if rows:
+        conn.executemany(
             """
             INSERT OR IGNORE INTO email_recipients (email_id, recipient_type, address)
             VALUES (?, ?, ?)
             """,
-            (email_id, recipient_type, address),
+            rows,
         )
 
 
-def _replace_recipients(conn, email_id, recipients, cc):
-    """Rewrite the TO/CC rows so the DB mirrors the latest caller payload."""
-    conn.execute("DELETE FROM email_recipients WHERE email_id = ?", (email_id,))
-    _insert_recipients(conn, email_id, "to", recipients)
-    _insert_recipients(conn, email_id, "cc", cc)
-
-
 def _clamp_priority(value, default=1):
     """Clamp stored priority values into the app's 1..3 range."""
     try:
@@ -590,6 +1105,7 @@ def _normalize_archived_flag(value):
     return _normalize_optional_flag(value)
 
 
+@_cached_read
 def count_mailbox_emails(
     *,
     email_type=None,
@@ -606,8 +1122,9 @@ def count_mailbox_emails(
         include_archived=include_archived,
         archived_only=archived_only,
         search_query=search_query,
+        db_path=db_path,
     )
-    with db_session(db_path) as conn:
+    with read_session(db_path) as conn:
         row = conn.execute(
             f"""
             SELECT COUNT(*) AS total
@@ -619,6 +1136,7 @@ def count_mailbox_emails(
     return int(row["total"] or 0) if row else 0
 
 
+@_cached_read
 def fetch_mailbox_page(
     *,
     email_type=None,
@@ -640,10 +1158,11 @@ def fetch_mailbox_page(
         include_archived=include_archived,
         archived_only=archived_only,
         search_query=search_query,
+        db_path=db_path,
     )
     order_by_sql = _resolve_mailbox_sort_sql(sort_code)
-    with db_session(db_path) as conn:
-        cur = conn.execute(
+    with read_session(db_path) as conn:
+        cur = _tuple_cursor(conn).execute(
             f"""
             {MAILBOX_LIST_SELECT_SQL}
             {clause}
@@ -652,7 +1171,7 @@ def fetch_mailbox_page(
             """,
             [*params, safe_limit, safe_offset],
         )
-        return [_row_to_dict(r) for r in cur.fetchall()]
+        return [_mailbox_row_to_dict(r) for r in cur]
 
 
 def fetch_mailbox_ids(
@@ -671,9 +1190,10 @@ def fetch_mailbox_ids(
         include_archived=include_archived,
         archived_only=archived_only,
         search_query=search_query,
+        db_path=db_path,
     )
-    with db_session(db_path) as conn:
-        cur = conn.execute(
+    with read_session(db_path) as conn:
+        cur = _tuple_cursor(conn).execute(
             f"""
             SELECT m.id
             FROM email_messages m
@@ -682,7 +1202,7 @@ def fetch_mailbox_ids(
             """,
             params,
         )
-        return [int(row["id"]) for row in cur.fetchall() if row and row["id"] is not None]
+        return [int(email_id) for (email_id,) in cur if email_id is not None]
 
 
 def get_app_setting(key, default=None, db_path=DB_DEFAULT):
@@ -721,13 +1241,13 @@ def set_app_setting(key, value, db_path=DB_DEFAULT):
             return None
         conn.execute(
             """
-            INSERT INTO app_settings (key, value)
-            VALUES (?, ?)
+            INSERT INTO app_settings (key, value, updated_at)
+            VALUES (?, ?, ?)
             ON CONFLICT(key) DO UPDATE
             SET value = excluded.value,
-                updated_at = CURRENT_TIMESTAMP
+                updated_at = excluded.updated_at
             """,
-            (setting_key, normalized_value),
+            (setting_key, normalized_value, _utc_timestamp()),
         )
     return normalized_value
 
@@ -748,22 +1268,17 @@ def set_user_display_name(display_name, db_path=DB_DEFAULT):
     )
 
 
+@_cached_read
 def fetch_email_by_id(email_id, db_path=DB_DEFAULT):
     """Fetch one normalized email row by its local id."""
-    with db_session(db_path) as conn:
-        cur = conn.execute(
-            f"""
-            {EMAIL_SELECT_SQL}
-            WHERE m.id = ?
-            """,
-            (email_id,),
-        )
+    with read_session(db_path) as conn:
+        cur = _tuple_cursor(conn).execute(EMAIL_BY_ID_SQL, (email_id,))
         row = cur.fetchone()
         return _row_to_dict(row) if row else None
 
 
-def fetch_emails_by_ids(email_ids, db_path=DB_DEFAULT):
-    """Fetch multiple emails by ID while preserving the requested order."""
+def _normalize_email_ids(email_ids):
+    """Keep positive integer ids once each, in the caller's order."""
     seen = set()
     normalized_ids = []
     for raw_id in email_ids or []:
@@ -775,22 +1290,33 @@ def fetch_emails_by_ids(email_ids, db_path=DB_DEFAULT):
             continue
         seen.add(email_id)
         normalized_ids.append(email_id)
+    return normalized_ids
+
+
+@lru_cache(maxsize=128)
+def _rows_by_ids_sql(select_sql, id_count):
+    """Return the IN-list lookup SQL for one id count so repeated sizes reuse statements."""
+    placeholders = ", ".join("?" for _ in range(id_count))
+    return f"""
+{select_sql}
+WHERE m.id IN ({placeholders})
+"""
+
 
+def _fetch_rows_by_ids(email_ids, select_sql, convert_row, db_path):
+    """Fetch rows for ``email_ids`` and return converted dicts in the requested order."""
+    normalized_ids = _normalize_email_ids(email_ids)
     if not normalized_ids:
         return []
 
-    placeholders = ", ".join("?" for _ in normalized_ids)
-    with db_session(db_path) as conn:
-        cur = conn.execute(
-            f"""
-            {EMAIL_SELECT_SQL}
-            WHERE m.id IN ({placeholders})
-            """,
+    with read_session(db_path) as conn:
+        cur = _tuple_cursor(conn).execute(
+            _rows_by_ids_sql(select_sql, len(normalized_ids)),
             normalized_ids,
         )
         rows_by_id = {}
-        for row in cur.fetchall():
-            row_dict = _row_to_dict(row)
+        for row in cur:
+            row_dict = convert_row(row)
             rows_by_id[row_dict["id"]] = row_dict
 
     ordered_rows = []
@@ -801,70 +1327,113 @@ def fetch_emails_by_ids(email_ids, db_path=DB_DEFAULT):
     return ordered_rows
 
 
+def fetch_emails_by_ids(email_ids, db_path=DB_DEFAULT):
+    """Fetch multiple emails by ID while preserving the requested order."""
+    return _fetch_rows_by_ids(email_ids, EMAIL_SELECT_SQL, _row_to_dict, db_path)
+
+
+def _email_state_row_to_dict(row):
+    """Convert one EMAIL_STATE_SELECT_SQL tuple row."""
+    email_id, external_id, provider_draft_id, email_type, is_read, is_archived = row
+    return {
+        "id": email_id,
+        "external_id": external_id,
+        "provider_draft_id": provider_draft_id,
+        "type": email_type,
+        "is_read": bool(is_read),
+        "is_archived": bool(is_archived),
+    }
+
+
+def fetch_email_states_by_ids(email_ids, db_path=DB_DEFAULT):
+    """Fetch only id/provider/type/read/archive state for bulk actions, in requested order."""
+    return _fetch_rows_by_ids(email_ids, EMAIL_STATE_SELECT_SQL, _email_state_row_to_dict, db_path)
+
+
+def fetch_existing_external_ids(external_ids, db_path=DB_DEFAULT):
+    """Return the subset of provider message ids that already have a local row."""
+    unique_ids = list(dict.fromkeys(str(value) for value in external_ids or () if value))
+    if not unique_ids:
+        return set()
+    placeholders = ", ".join("?" for _ in unique_ids)
+    with read_session(db_path) as conn:
+        cur = _tuple_cursor(conn).execute(
+            f"SELECT external_id FROM email_messages WHERE external_id IN ({placeholders})",
+            unique_ids,
+        )
+        return {external_id for (external_id,) in cur}
+
+
 def fetch_email_by_provider_draft_id(provider_draft_id, db_path=DB_DEFAULT):
     """Fetch one normalized email row by its Gmail draft id."""
     if not provider_draft_id:
         return None
-    with db_session(db_path) as conn:
-        cur = conn.execute(
-            f"""
-            {EMAIL_SELECT_SQL}
-            WHERE m.provider_draft_id = ?
-            """,
-            (provider_draft_id,),
-        )
+    with read_session(db_path) as conn:
+        cur = _tuple_cursor(conn).execute(EMAIL_BY_PROVIDER_DRAFT_ID_SQL, (provider_draft_id,))
         row = cur.fetchone()
         return _row_to_dict(row) if row else None
 
 
-def fetch_thread_emails(thread_id, db_path=DB_DEFAULT):
-    """Fetch one thread's emails in chronological order."""
+@_cached_read
+def fetch_thread_emails(thread_id, main_only=False, db_path=DB_DEFAULT):
+    """Fetch one thread's emails in chronological order, optionally only live mailbox rows."""
     if not thread_id:
         return []
-    with db_session(db_path) as conn:
-        cur = conn.execute(
-            f"""
-            {EMAIL_SELECT_SQL}
-            WHERE m.thread_id = ?
-            ORDER BY m.received_at ASC, m.id ASC
-            """,
-            (thread_id,),
-        )
-        return [_row_to_dict(r) for r in cur.fetchall()]
+    thread_sql = EMAIL_THREAD_MAIN_SQL if main_only else EMAIL_THREAD_SQL
+    with read_session(db_path) as conn:
+        cur = _tuple_cursor(conn).execute(thread_sql, (thread_id,))
+        return [_row_to_dict(r) for r in cur]
 
 
 def mark_read(email_id, read=True, db_path=DB_DEFAULT):
     """Mark read.
     """
-    # Update read state without mutating unrelated fields.
+    # Update read state without mutating unrelated fields; rows already in the target
+    # state are skipped so re-opening an email does not invalidate READ_CACHE.
+    read_value = 1 if read else 0
     with db_session(db_path) as conn:
         conn.execute(
-            "UPDATE email_messages SET is_read = ? WHERE id = ?",
-            (1 if read else 0, email_id),
+            "UPDATE email_messages SET is_read = ? WHERE id = ? AND is_read != ?",
+            (read_value, email_id, read_value),
         )
 
 
+def mark_read_many(email_ids, read=True, db_path=DB_DEFAULT):
+    """Set the read flag for several emails with one UPDATE."""
+    normalized_ids = _normalize_email_ids(email_ids)
+    if not normalized_ids:
+        return
+    placeholders = ", ".join("?" for _ in normalized_ids)
+    read_value = 1 if read else 0
+    with db_session(db_path) as conn:
+        conn.execute(
+            f"UPDATE email_messages SET is_read = ? WHERE id IN ({placeholders}) AND is_read != ?",
+            (read_value, *normalized_ids, read_value),
+        )
+
+
+PROVIDER_ROW_LOOKUP_SQL = f"""
+SELECT
+    {PROVIDER_ROW_SELECT_FIELDS}
+FROM email_messages
+WHERE external_id = :external_id OR provider_draft_id = :provider_draft_id
+ORDER BY CASE WHEN external_id = :external_id THEN 0 ELSE 1 END
+LIMIT 1
+"""
+
+
 def _fetch_existing_provider_row(conn, external_id, provider_draft_id):
     """Find the local row matched to a provider message or draft identifier."""
-    for column_name, raw_value in (
-        ("external_id", external_id),
-        ("provider_draft_id", provider_draft_id),
-    ):
-        if not raw_value:
-            continue
-
-        row = conn.execute(
-            f"""
-            SELECT
-                {PROVIDER_ROW_SELECT_FIELDS}
-            FROM email_messages
-            WHERE {column_name} = ?
-            """,
-            (raw_value,),
-        ).fetchone()
-        if row is not None:
-            return row
-    return None
+    if not external_id and not provider_draft_id:
+        return None
+    # One probe over both unique indexes; an external_id match still wins over a draft-id match.
+    return conn.execute(
+        PROVIDER_ROW_LOOKUP_SQL,
+        {
+            "external_id": external_id or None,
+            "provider_draft_id": provider_draft_id or None,
+        },
+    ).fetchone()
 
 
 def _create_local_email_row(
@@ -893,7 +1462,7 @@ def _create_local_email_row(
             is_read,
             received_at
         )
-        VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, 1, CURRENT_TIMESTAMP)
+        VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, 1, ?)
         """,
         (
             provider_draft_id,
@@ -903,14 +1472,14 @@ def _create_local_email_row(
             body,
             email_type,
             _clamp_priority(priority),
+            _utc_timestamp(),
         ),
     )
     return cur.lastrowid
 
 
-def upsert_email_from_provider(email_data, db_path=DB_DEFAULT):
-    """Upsert email from provider.
-    """
+def _normalize_provider_email(email_data):
+    """Validate one provider payload and return ``(external_id, provider_draft_id, normalized)``."""
     # Accept either message external_id or provider draft id as the stable upsert key.
     external_id = (email_data.get("external_id") or "").strip()
     provider_draft_id = (email_data.get("provider_draft_id") or "").strip()
@@ -925,7 +1494,7 @@ def upsert_email_from_provider(email_data, db_path=DB_DEFAULT):
 
     received_at = (email_data.get("received_at") or "").strip()
     if not received_at:
-        received_at = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        received_at = _utc_timestamp()
 
     # Normalize provider payload into one canonical shape before DB reads/writes.
     normalized = {
@@ -933,7 +1502,8 @@ def upsert_email_from_provider(email_data, db_path=DB_DEFAULT):
         "provider_draft_id": provider_draft_id or None,
         "title": (email_data.get("title") or "(No subject)").strip(),
         "sender": (email_data.get("sender") or "unknown@unknown").strip(),
-        "body": email_data.get("body") or "",
+        # None means "not fetched" (metadata-only sync), so updates keep the stored body.
+        "body": email_data.get("body"),
         "body_html": email_data.get("body_html"),
         "type": message_type,
         "priority": priority,
@@ -950,135 +1520,170 @@ def upsert_email_from_provider(email_data, db_path=DB_DEFAULT):
         "ai_confidence": _normalize_ai_confidence(email_data.get("ai_confidence")),
         "is_archived": _normalize_archived_flag(email_data.get("is_archived")),
     }
+    return external_id, provider_draft_id, normalized
+
+
+def _upsert_provider_row(conn, external_id, provider_draft_id, normalized):
+    """Update or insert one normalized provider row and return its local id."""
+    # First match by message id, then by provider draft id so compose flows
+    # and normal syncs can converge on the same local row.
+    existing = _fetch_existing_provider_row(conn, external_id, provider_draft_id)
+
+    if existing:
+        # Provider sync is allowed to refresh source-of-truth mailbox state like
+        # bodies and read flags, but it should not casually wipe out local summary,
+        # draft, or AI work that the app has already produced for this row.
+        # Keep locally generated summary/draft/classification unless provider has newer explicit values.
+        summary_value = existing["summary"] if existing["summary"] else normalized["summary"]
+        body_value = normalized["body"]
+        if body_value is None:
+            body_value = existing["body"]
+        draft_value = existing["draft"] if existing["draft"] else normalized["draft"]
+        body_html_value = normalized["body_html"]
+        if body_html_value is None:
+            body_html_value = existing["body_html"]
+        ai_category_value = normalized["ai_category"]
+        if ai_category_value is None:
+            ai_category_value = existing["ai_category"]
+        ai_needs_response_value = normalized["ai_needs_response"]
+        if ai_needs_response_value is None:
+            ai_needs_response_value = existing["ai_needs_response"]
+        ai_confidence_value = normalized["ai_confidence"]
+        if ai_confidence_value is None:
+            ai_confidence_value = existing["ai_confidence"]
+        is_archived_value = normalized["is_archived"]
+        if is_archived_value is None:
+            is_archived_value = existing["is_archived"]
+        existing_priority = existing["priority"]
+        priority_value = _clamp_priority(existing_priority, default=normalized["priority"])
+        type_value = normalized["type"]
+        existing_type = (existing["type"] or "").strip()
+        # Preserve local/AI triage for existing rows; provider sync should
+        # refresh content/read state but not reclassify old emails.
+        if existing_type in ALLOWED_TYPES:
+            type_value = existing_type
+        conn.execute(
+            """
+            UPDATE email_messages
+            SET thread_id = ?,
+                title = ?,
+                sender = ?,
+                body = ?,
+                body_html = ?,
+                provider_draft_id = ?,
+                type = ?,
+                priority = ?,
+                is_read = ?,
+                received_at = ?,
+                summary = ?,
+                draft = ?,
+                is_archived = ?,
+                ai_category = ?,
+                ai_needs_response = ?,
+                ai_confidence = ?
+            WHERE id = ?
+            """,
+            (
+                normalized["thread_id"],
+                normalized["title"],
+                normalized["sender"],
+                body_value,
+                body_html_value,
+                normalized["provider_draft_id"] or existing["provider_draft_id"],
+                type_value,
+                priority_value,
+                normalized["is_read"],
+                normalized["received_at"],
+                summary_value,
+                draft_value,
+                is_archived_value,
+                ai_category_value,
+                ai_needs_response_value,
+                ai_confidence_value,
+                existing["id"],
+            ),
+        )
+        email_id = existing["id"]
+    else:
+        # Insert a new row when provider identifiers do not match any local email.
+        cur = conn.execute(
+            """
+            INSERT INTO email_messages (
+                external_id,
+                provider_draft_id,
+                thread_id,
+                title,
+                sender,
+                body,
+                body_html,
+                type,
+                priority,
+                is_read,
+                received_at,
+                summary,
+                draft,
+                is_archived,
+                ai_category,
+                ai_needs_response,
+                ai_confidence
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                external_id,
+                normalized["provider_draft_id"],
+                normalized["thread_id"],
+                normalized["title"],
+                normalized["sender"],
+                normalized["body"] or "",
+                normalized["body_html"],
+                normalized["type"],
+                normalized["priority"],
+                normalized["is_read"],
+                normalized["received_at"],
+                normalized["summary"],
+                normalized["draft"],
+                normalized["is_archived"] or 0,
+                normalized["ai_category"],
+                normalized["ai_needs_response"],
+                normalized["ai_confidence"],
+            ),
+        )
+        email_id = cur.lastrowid
+    return email_id
 
+
+def upsert_email_from_provider(email_data, db_path=DB_DEFAULT):
+    """Upsert email from provider.
+    """
+    return upsert_emails_from_provider([email_data], db_path=db_path)[0]
+
+
+def upsert_emails_from_provider(email_data_list, db_path=DB_DEFAULT):
+    """Upsert a batch of provider emails in one transaction and return their local ids."""
+    # Validate the whole batch before taking the write lock so a bad payload writes nothing.
+    prepared = [_normalize_provider_email(email_data) for email_data in email_data_list or []]
+    if not prepared:
+        return []
+
+    email_ids = []
+    # Keyed by row id so a message repeated in one batch keeps only its latest recipients.
+    recipients_by_id = {}
     with db_session(db_path) as conn:
-        # First match by message id, then by provider draft id so compose flows
-        # and normal syncs can converge on the same local row.
-        existing = _fetch_existing_provider_row(conn, external_id, provider_draft_id)
-
-        if existing:
-            # Provider sync is allowed to refresh source-of-truth mailbox state like
-            # bodies and read flags, but it should not casually wipe out local summary,
-            # draft, or AI work that the app has already produced for this row.
-            # Keep locally generated summary/draft/classification unless provider has newer explicit values.
-            summary_value = existing["summary"] if existing["summary"] else normalized["summary"]
-            draft_value = existing["draft"] if existing["draft"] else normalized["draft"]
-            body_html_value = normalized["body_html"]
-            if body_html_value is None:
-                body_html_value = existing["body_html"]
-            ai_category_value = normalized["ai_category"]
-            if ai_category_value is None:
-                ai_category_value = existing["ai_category"]
-            ai_needs_response_value = normalized["ai_needs_response"]
-            if ai_needs_response_value is None:
-                ai_needs_response_value = existing["ai_needs_response"]
-            ai_confidence_value = normalized["ai_confidence"]
-            if ai_confidence_value is None:
-                ai_confidence_value = existing["ai_confidence"]
-            is_archived_value = normalized["is_archived"]
-            if is_archived_value is None:
-                is_archived_value = existing["is_archived"]
-            existing_priority = existing["priority"]
-            priority_value = _clamp_priority(existing_priority, default=normalized["priority"])
-            type_value = normalized["type"]
-            existing_type = (existing["type"] or "").strip()
-            # Preserve local/AI triage for existing rows; provider sync should
-            # refresh content/read state but not reclassify old emails.
-            if existing_type in ALLOWED_TYPES:
-                type_value = existing_type
-            conn.execute(
-                """
-                UPDATE email_messages
-                SET thread_id = ?,
-                    title = ?,
-                    sender = ?,
-                    body = ?,
-                    body_html = ?,
-                    provider_draft_id = ?,
-                    type = ?,
-                    priority = ?,
-                    is_read = ?,
-                    received_at = ?,
-                    summary = ?,
-                    draft = ?,
-                    is_archived = ?,
-                    ai_category = ?,
-                    ai_needs_response = ?,
-                    ai_confidence = ?
-                WHERE id = ?
-                """,
-                (
-                    normalized["thread_id"],
-                    normalized["title"],
-                    normalized["sender"],
-                    normalized["body"],
-                    body_html_value,
-                    normalized["provider_draft_id"] or existing["provider_draft_id"],
-                    type_value,
-                    priority_value,
-                    normalized["is_read"],
-                    normalized["received_at"],
-                    summary_value,
-                    draft_value,
-                    is_archived_value,
-                    ai_category_value,
-                    ai_needs_response_value,
-                    ai_confidence_value,
-                    existing["id"],
-                ),
-            )
-            email_id = existing["id"]
-        else:
-            # Insert a new row when provider identifiers do not match any local email.
-            cur = conn.execute(
-                """
-                INSERT INTO email_messages (
-                    external_id,
-                    provider_draft_id,
-                    thread_id,
-                    title,
-                    sender,
-                    body,
-                    body_html,
-                    type,
-                    priority,
-                    is_read,
-                    received_at,
-                    summary,
-                    draft,
-                    is_archived,
-                    ai_category,
-                    ai_needs_response,
-                    ai_confidence
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    external_id,
-                    normalized["provider_draft_id"],
-                    normalized["thread_id"],
-                    normalized["title"],
-                    normalized["sender"],
-                    normalized["body"],
-                    normalized["body_html"],
-                    normalized["type"],
-                    normalized["priority"],
-                    normalized["is_read"],
-                    normalized["received_at"],
-                    normalized["summary"],
-                    normalized["draft"],
-                    normalized["is_archived"] or 0,
-                    normalized["ai_category"],
-                    normalized["ai_needs_response"],
-                    normalized["ai_confidence"],
-                ),
-            )
-            email_id = cur.lastrowid
+        # Take the write lock up front instead of upgrading mid-batch after the first SELECT.
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        for external_id, provider_draft_id, normalized in prepared:
+            email_id = _upsert_provider_row(conn, external_id, provider_draft_id, normalized)
+            email_ids.append(email_id)
+            recipients_by_id[email_id] = (normalized["recipients"], normalized["cc"])
 
         # Rebuild recipients from normalized payload so local TO/CC stay authoritative.
-        _replace_recipients(conn, email_id, normalized["recipients"], normalized["cc"])
-
-    return email_id
+        _replace_recipients_many(
+            conn,
+            [(email_id, recipients, cc) for email_id, (recipients, cc) in recipients_by_id.items()],
+        )
+    return email_ids
 
 
 def set_email_type(email_id, new_type, db_path=DB_DEFAULT):
@@ -1205,7 +1810,7 @@ def save_local_draft(
                     type = 'draft',
                     is_archived = 0,
                     is_read = 1,
-                    received_at = CURRENT_TIMESTAMP
+                    received_at = ?
                 WHERE id = ?
                 """,
                 (
@@ -1214,6 +1819,7 @@ def save_local_draft(
                     clean_title,
                     sender,
                     clean_body,
+                    _utc_timestamp(),
                     draft_id,
                 ),
             )
@@ -1,16 +1,21 @@
 """Tiny structured logger used across startup, sync, and AI flows."""
 
+import atexit
 import logging
 import os
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
 from threading import Lock
 
 LOGGER_NAME = "app.debug"
 DEFAULT_LOG_PATH = "instance/debug_log.txt"
 MAX_FIELD_LENGTH = 1000
 _CONFIG_LOCK = Lock()
+# One background listener per resolved log file; callers only enqueue records.
+_LISTENERS = {}
+_active_target = None
 
 
 def _clean_value(value):
@@ -45,29 +50,48 @@ def get_debug_log_path():
     return str(_log_path())
 
 
+def _stop_listeners():
+    """Drain queued records to disk before the interpreter exits."""
+    global _active_target
+    with _CONFIG_LOCK:
+        _active_target = None
+        for listener in _LISTENERS.values():
+            listener.stop()
+        _LISTENERS.clear()
+
+
 def configure_debug_logger():
     """Create the rotating debug logger once and reuse it thereafter."""
+    global _active_target
     logger = logging.getLogger(LOGGER_NAME)
     target_path = _log_path()
+    # Fast path for every log call once setup has happened for this path.
+    if _active_target == str(target_path):
+        return logger
 
     with _CONFIG_LOCK:  # Serialize logger setup so we do not add duplicate handlers.
         target_path.parent.mkdir(parents=True, exist_ok=True)
         resolved_target = str(target_path.resolve())
-        for handler in logger.handlers:
-            existing = getattr(handler, "baseFilename", None)
-            if existing and str(Path(existing).resolve()) == resolved_target:
-                return logger
-
-        handler = RotatingFileHandler(
-            target_path,
-            maxBytes=2_000_000,
-            backupCount=3,
-            encoding="utf-8",
-        )
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        logger.setLevel(logging.INFO)
-        logger.propagate = False
-        logger.addHandler(handler)
+        if resolved_target not in _LISTENERS:
+            file_handler = RotatingFileHandler(
+                target_path,
+                maxBytes=2_000_000,
+                backupCount=3,
+                encoding="utf-8",
+            )
+            file_handler.setFormatter(logging.Formatter("%(message)s"))
+            # Request and sync threads only enqueue; the listener thread does the
+            # file writes, flushes, and rotation.
+            record_queue = SimpleQueue()
+            listener = QueueListener(record_queue, file_handler)
+            listener.start()
+            if not _LISTENERS:
+                atexit.register(_stop_listeners)
+            _LISTENERS[resolved_target] = listener
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(QueueHandler(record_queue))
+        _active_target = str(target_path)
         return logger
 
 
@@ -3,6 +3,7 @@
 import quopri
 import re
 import unicodedata
+from functools import lru_cache
 from html import unescape
 
 
@@ -36,6 +37,9 @@ _INVISIBLE_CHAR_PATTERN = re.compile(
     r"[\u00ad\u034f\u061c\u115f\u1160\u17b4\u17b5\u180e\u2000-\u200f\u2028-\u202f\u2060-\u206f\ufeff]"
 )
 _UNSAFE_TEXT_CONTROL_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+_INLINE_SPACE_RUN_PATTERN = re.compile(r"[ \t\f\v]+")
+_SPACED_NEWLINE_PATTERN = re.compile(r" *\n *")
+_EXCESS_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
 _QP_STRONG_ESCAPE_PATTERN = re.compile(r"(?:=[0-9A-F]{2}){2,}")
 _MOJIBAKE_SEQUENCE_PATTERN = re.compile(
     r"(?:"
@@ -197,9 +201,9 @@ def _normalize_visible_text(text):
     # Most callers want this "make it readable but keep paragraphs" cleanup pass
     # after decoding HTML or MIME parts from mail providers.
     cleaned = _sanitize_common_email_text(text)
-    cleaned = re.sub(r"[ \t\f\v]+", " ", cleaned)
-    cleaned = re.sub(r" *\n *", "\n", cleaned)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    cleaned = _INLINE_SPACE_RUN_PATTERN.sub(" ", cleaned)
+    cleaned = _SPACED_NEWLINE_PATTERN.sub("\n", cleaned)
+    cleaned = _EXCESS_BLANK_LINES_PATTERN.sub("\n\n", cleaned)
     return cleaned.strip()
 
 
@@ -275,7 +279,12 @@ def html_to_text(raw_html):
     html = str(raw_html or "")
     if not html:
         return ""
+    return _html_string_to_text(html)
 
+
+# Row reads and AI checks convert the same stored HTML repeatedly; keep a few recent bodies.
+@lru_cache(maxsize=64)
+def _html_string_to_text(html):
     cleaned = html.replace("\r\n", "\n").replace("\r", "\n")
     cleaned = _HTML_COMMENT_PATTERN.sub(" ", cleaned)
     cleaned = _HTML_DROP_BLOCK_PATTERN.sub(" ", cleaned)
@@ -339,9 +348,9 @@ def normalize_outgoing_text(value, *, preserve_newlines=True):
     text = _sanitize_common_email_text(value)
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     if preserve_newlines:
-        text = re.sub(r"[ \t\f\v]+", " ", text)
-        text = re.sub(r" *\n *", "\n", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _INLINE_SPACE_RUN_PATTERN.sub(" ", text)
+        text = _SPACED_NEWLINE_PATTERN.sub("\n", text)
+        text = _EXCESS_BLANK_LINES_PATTERN.sub("\n\n", text)
         return text.strip()
     return " ".join(text.split()).strip()
 
@@ -375,6 +384,14 @@ def repair_body_text(body_text, body_html=None):
     return _normalize_visible_text(plain_text)
 
 
+@lru_cache(maxsize=4096)
+def _repair_header_string(value):
+    return normalize_outgoing_text(value, preserve_newlines=False)
+
+
 def repair_header_text(value):
     """Repair and normalize short header text like subject or sender."""
+    # List pages and live polling repair the same subjects/senders over and over.
+    if isinstance(value, str):
+        return _repair_header_string(value)
     return normalize_outgoing_text(value, preserve_newlines=False)
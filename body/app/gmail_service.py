@@ -1,12 +1,12 @@
 """Gmail integration: auth, MIME parsing, sync loops, and send/draft helpers."""
 
-import base64
 import hashlib
 import mimetypes
 import os
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.message import EmailMessage
 from email.utils import getaddresses
@@ -14,8 +14,12 @@ from pathlib import Path
 
 from .db import (
     fetch_email_by_id,
+    fetch_existing_external_ids,
+    get_app_setting,
+    set_app_setting,
     update_email_ai_fields,
     upsert_email_from_provider,
+    upsert_emails_from_provider,
 )
 from .email_content import (
     contains_common_mojibake,
@@ -37,11 +41,29 @@ try:
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
+    from googleapiclient.model import JsonModel
 except ImportError:  # Optional dependency when we are running in local-only mode.
     Request = None
     Credentials = None
     InstalledAppFlow = None
     build = None
+    JsonModel = None
+
+try:
+    # SIMD-accelerated drop-in for the base64 functions used below.
+    import pybase64 as base64
+except ImportError:  # Optional speedup; the stdlib module has the same API.
+    import base64
+
+try:
+    import xxhash
+except ImportError:  # Optional speedup for attachment dedupe keys.
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:  # Optional speedup for Gmail API response parsing.
+    orjson = None
 
 SCOPES = [
     "https://www.googleapis.com/auth/gmail.modify",
@@ -54,6 +76,45 @@ DB_DEFAULT = str(PROJECT_ROOT / "instance" / "app.sqlite")
 SYNC_INTERVAL_SECONDS = int(os.getenv("GMAIL_SYNC_INTERVAL_SECONDS", "10"))
 SYNC_MAX_RESULTS = int(os.getenv("GMAIL_SYNC_MAX_RESULTS", "25"))
 AI_TRIAGE_PER_SYNC = int(os.getenv("GMAIL_AI_TRIAGE_PER_SYNC", "0"))
+# Gmail accepts 100 sub-requests per batch but starts rate limiting (429) the items of
+# batches much above 50, so batches stay at that size.
+GMAIL_BATCH_MAX_REQUESTS = 50
+# Rate-limited or transiently failed batch items are re-queued this many extra times.
+GMAIL_BATCH_RETRY_ATTEMPTS = 2
+GMAIL_BATCH_RETRY_DELAY_SECONDS = 1.0
+GMAIL_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Headers _to_db_record reads when refreshing an already-mirrored message from metadata.
+GMAIL_METADATA_HEADERS = ["Subject", "From", "To", "Cc"]
+# Reload/refresh cached credentials this long before they expire.
+CREDENTIALS_REFRESH_MARGIN_SECONDS = 60
+# Gmail system labels folded into one bitmask per message by _label_mask.
+_LABEL_DRAFT = 1
+_LABEL_SENT = 2
+_LABEL_SPAM = 4
+_LABEL_UNREAD = 8
+_LABEL_STARRED = 16
+_LABEL_IMPORTANT = 32
+_LABEL_TRASH = 64
+_LABEL_BITS = {
+    "DRAFT": _LABEL_DRAFT,
+    "SENT": _LABEL_SENT,
+    "SPAM": _LABEL_SPAM,
+    "UNREAD": _LABEL_UNREAD,
+    "STARRED": _LABEL_STARRED,
+    "IMPORTANT": _LABEL_IMPORTANT,
+    "TRASH": _LABEL_TRASH,
+}
+# Starred outranks important; indexed by the STARRED/IMPORTANT bits of a mask.
+_PRIORITY_BY_MASK = {
+    0: 1,
+    _LABEL_IMPORTANT: 2,
+    _LABEL_STARRED: 3,
+    _LABEL_STARRED | _LABEL_IMPORTANT: 3,
+}
+# Incremental sync cursor; history.list only reports these change kinds back to us.
+GMAIL_HISTORY_ID_SETTING_KEY = "gmail_history_id"
+GMAIL_HISTORY_TYPES = ["messageAdded", "labelAdded", "labelRemoved"]
+SYNC_PARSE_WORKERS = max(1, int(os.getenv("GMAIL_SYNC_PARSE_WORKERS", "4")))
 BULK_SENDER_MARKERS = (
     "no-reply",
     "noreply",
@@ -65,6 +126,8 @@ BULK_SENDER_MARKERS = (
     "announcements",
     "marketing",
 )
+_URLSAFE_TO_STD_BASE64 = str.maketrans("-_", "+/")
+_CID_SRC_PATTERN = re.compile(r"""src\s*=\s*(['"])cid:([^'"]+)\1""", re.IGNORECASE)
 
 
 # The service layer has two jobs: translate Gmail payloads into the local DB
@@ -74,12 +137,76 @@ class _GmailSyncState:
 
     def __init__(self):
         self.last_sync_at = 0.0
+        # Held from a successful trigger until the worker finishes that sync run.
         self.lock = threading.Lock()
+        # One long-lived worker waits on ``wake`` and runs the ``pending`` job.
+        self.wake = threading.Event()
+        self.pending = None
+        self.worker = None
 
 
 GMAIL_SYNC_STATE = _GmailSyncState()
 
 
+if JsonModel is not None and orjson is not None:
+
+    class _OrjsonModel(JsonModel):
+        """JsonModel that parses and encodes Gmail API bodies with orjson."""
+
+        def serialize(self, body_value):
+            if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+                body_value = {"data": body_value}
+            return orjson.dumps(body_value)
+
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Non-JSON error bodies keep the stock fallback behavior.
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                body = body["data"]
+            return body
+
+else:
+    _OrjsonModel = None
+
+
+def _json_model():
+    """Return the request/response model for the Gmail client (None keeps the default)."""
+    # Batched sub-responses go through the same model, so full-format messages with
+    # large base64 bodies are parsed by orjson on both the single and batch paths.
+    return _OrjsonModel() if _OrjsonModel is not None else None
+
+
+class _GmailServiceCache:
+    """Process-wide credentials plus one Gmail client per thread."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.credentials = None
+        # googleapiclient's httplib2 transport is not thread-safe, so clients stay per thread.
+        self.local = threading.local()
+
+
+GMAIL_SERVICE_CACHE = _GmailServiceCache()
+_PARSE_EXECUTOR = None
+_PARSE_EXECUTOR_LOCK = threading.Lock()
+
+
+def _parse_executor():
+    """Return the shared worker pool used to build sync records."""
+    global _PARSE_EXECUTOR
+    with _PARSE_EXECUTOR_LOCK:
+        if _PARSE_EXECUTOR is None:
+            # Long-lived workers keep their per-thread Gmail clients between sync runs.
+            _PARSE_EXECUTOR = ThreadPoolExecutor(
+                max_workers=SYNC_PARSE_WORKERS,
+                thread_name_prefix="gmail-parse",
+            )
+        return _PARSE_EXECUTOR
+
+
 def _candidate_credentials_paths():
     """Return the credential-file locations we are willing to try."""
     configured_path = os.getenv("GMAIL_CREDENTIALS_FILE")
@@ -167,15 +294,45 @@ def _load_credentials():
     return credentials
 
 
+def _credentials_are_fresh(credentials):
+    """Return whether cached credentials stay valid past the refresh margin."""
+    if not credentials or not credentials.valid:
+        return False
+    expiry = getattr(credentials, "expiry", None)
+    if expiry is None:
+        return True
+    # google-auth keeps ``expiry`` as a naive UTC datetime.
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (expiry - now).total_seconds() > CREDENTIALS_REFRESH_MARGIN_SECONDS
+
+
+def _cached_credentials():
+    """Return shared credentials, re-reading the token file only near expiry."""
+    cache = GMAIL_SERVICE_CACHE
+    with cache.lock:
+        if not _credentials_are_fresh(cache.credentials):
+            cache.credentials = _load_credentials()
+        return cache.credentials
+
+
 def _get_service():
     """Build the Gmail API client, or return ``None`` when auth is unavailable."""
-    # Try the requested value first, then fall back safely if it fails.
-    # Only build the Gmail API client once auth is available.
-    credentials = _load_credentials()
+    # Only build the Gmail API client once auth is available, and reuse it on this
+    # thread until the shared credentials are replaced.
+    credentials = _cached_credentials()
     if not credentials:
         return None
+    local = GMAIL_SERVICE_CACHE.local
+    if getattr(local, "credentials", None) is credentials and local.service is not None:
+        return local.service
     try:
-        return build("gmail", "v1", credentials=credentials, cache_discovery=False)
+        service = build(
+            "gmail",
+            "v1",
+            credentials=credentials,
+            cache_discovery=False,
+            model=_json_model(),
+        )
     except Exception as exc:
         log_exception(
             action_type="gmail_auth",
@@ -185,19 +342,18 @@ def _get_service():
             details="Gmail service initialization failed.",
         )
         return None
+    local.credentials = credentials
+    local.service = service
+    return service
 
 
-def _extract_named_header(headers, header_name):
-    """Read a case-insensitive header value from a Gmail header list."""
-    for header in headers or []:
-        if header.get("name", "").lower() == header_name.lower():
-            return header.get("value", "")
-    return ""
-
-
-def _extract_header(payload, header_name):
-    """Read a top-level message header from a Gmail payload."""
-    return _extract_named_header(payload.get("headers", []) or [], header_name)
+def _header_index(container):
+    """Map lowercase header names to values for one payload/part (first occurrence wins)."""
+    # One pass per payload replaces a lowercasing scan per lookup.
+    index = {}
+    for header in container.get("headers") or []:
+        index.setdefault((header.get("name") or "").lower(), header.get("value", ""))
+    return index
 
 
 def _decode_body_bytes(raw_data):
@@ -206,16 +362,12 @@ def _decode_body_bytes(raw_data):
         return b""
     padded = f"{raw_data}{'=' * (-len(raw_data) % 4)}"
     try:
-        return base64.urlsafe_b64decode(padded.encode("utf-8"))
+        # Both codecs accept ASCII str directly, so skip the intermediate bytes copy.
+        return base64.urlsafe_b64decode(padded)
     except Exception:
         return b""
 
 
-def _extract_part_header(part, header_name):
-    """Read one MIME-part header."""
-    return _extract_named_header(part.get("headers", []) or [], header_name)
-
-
 def _normalize_cid(raw_value):
     """Normalize ``cid:`` tokens so HTML replacement can match them reliably."""
     if not raw_value:
@@ -223,12 +375,10 @@ def _normalize_cid(raw_value):
     return raw_value.strip().strip("<>").lower()
 
 
-def _attachment_bytes(service, message_id, attachment_id):
-    """Attachment bytes.
-    """
-    # Process attachment bytes without losing the filename or content-type metadata.
+def _attachment_data(service, message_id, attachment_id):
+    """Fetch one attachment's raw URL-safe base64 text, or an empty string on failure."""
     if not service or not message_id or not attachment_id:
-        return b""
+        return ""
     try:
         response = (
             service.users()
@@ -238,8 +388,22 @@ def _attachment_bytes(service, message_id, attachment_id):
             .execute()
         )
     except Exception:
-        return b""
-    return _decode_body_bytes(response.get("data"))
+        return ""
+    return response.get("data") or ""
+
+
+def _attachment_bytes(service, message_id, attachment_id):
+    """Attachment bytes.
+    """
+    # Process attachment bytes without losing the filename or content-type metadata.
+    return _decode_body_bytes(_attachment_data(service, message_id, attachment_id))
+
+
+def _inline_image_data_uri(mime_type, raw_data):
+    """Build a data URI straight from Gmail's URL-safe base64 text."""
+    # Standard and URL-safe base64 differ only in two symbols, so no decode/re-encode is needed.
+    padded = f"{raw_data}{'=' * (-len(raw_data) % 4)}"
+    return f"data:{mime_type};base64,{padded.translate(_URLSAFE_TO_STD_BASE64)}"
 
 
 def _iter_parts(payload):
@@ -250,10 +414,10 @@ def _iter_parts(payload):
     # Walk MIME parts iteratively so large trees do not trip recursion depth limits.
     while stack:
         current = stack.pop()
-        children = current.get("parts") or []
+        yield current
+        children = current.get("parts")
         if children:
             stack.extend(reversed(children))
-        yield current
 
 
 def _guess_filename(content_type, index):
@@ -325,6 +489,15 @@ def _extract_attachment_metadata(payload):
     return metadata
 
 
+def _attachment_digest(content):
+    """Return an in-memory dedupe digest for attachment bytes (not a security boundary)."""
+    if not content:
+        return b""
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(content)
+    return hashlib.sha1(content).digest()
+
+
 def _merge_attachment_payloads(existing_attachments, incoming_attachments):
     """Merge attachment lists while deduplicating by content signature."""
     merged = []
@@ -336,8 +509,7 @@ def _merge_attachment_payloads(existing_attachments, incoming_attachments):
         content_type = (attachment.get("content_type") or "").strip().lower() or "application/octet-stream"
         if "/" not in content_type:
             content_type = "application/octet-stream"
-        digest = hashlib.sha1(content).hexdigest() if content else "empty"
-        key = (filename, content_type, len(content), digest)
+        key = (filename, content_type, len(content), _attachment_digest(content))
         if key in seen:
             continue
         seen.add(key)
@@ -399,6 +571,103 @@ def _get_message_data(service, external_id):
         return None
 
 
+def _is_retryable_gmail_error(exc):
+    """Return whether a Gmail API error is a rate limit or transient server failure."""
+    status = getattr(getattr(exc, "resp", None), "status", None)
+    try:
+        status = int(status)
+    except (TypeError, ValueError):
+        return False
+    # Gmail reports per-user quota exhaustion as 403 rateLimitExceeded as well as 429.
+    return status in GMAIL_RETRYABLE_STATUS_CODES or (
+        status == 403 and "ratelimitexceeded" in str(exc).lower()
+    )
+
+
+def _batch_get_with_failures(service, resource_ids, build_request, *, action, id_field, details):
+    """Batch-fetch resources; return ``(results, failed_ids)`` after retrying transient failures.
+
+    ``failed_ids`` holds ids that still hit a rate limit or transient error after the retries,
+    so callers can try them again later. Permanent per-item errors (e.g. 404) are only logged.
+    """
+    results = {}
+    if not service or not resource_ids:
+        return results, []
+
+    pending = list(dict.fromkeys(resource_ids))
+    for attempt in range(GMAIL_BATCH_RETRY_ATTEMPTS + 1):
+        retry_ids = []
+
+        def _store_response(request_id, response, exception):
+            # Per-item failures are logged like single fetches so one bad id does not sink the page.
+            if exception is None:
+                results[request_id] = response
+                return
+            if _is_retryable_gmail_error(exception):
+                retry_ids.append(request_id)
+            log_exception(
+                action_type="gmail_api",
+                action=action,
+                error=exception,
+                component="gmail_service",
+                details=details,
+                attempt=attempt + 1,
+                **{id_field: request_id},
+            )
+
+        for start in range(0, len(pending), GMAIL_BATCH_MAX_REQUESTS):
+            chunk = pending[start:start + GMAIL_BATCH_MAX_REQUESTS]
+            batch = service.new_batch_http_request(callback=_store_response)
+            for resource_id in chunk:
+                batch.add(build_request(resource_id), request_id=resource_id)
+            try:
+                batch.execute()
+            except Exception as exc:
+                log_exception(
+                    action_type="gmail_api",
+                    action=f"{action}_batch",
+                    error=exc,
+                    component="gmail_service",
+                    details=details,
+                    attempt=attempt + 1,
+                )
+                # A failed HTTP call answers none of its items, so all unanswered ids retry.
+                retry_ids.extend(
+                    resource_id for resource_id in chunk if resource_id not in results
+                )
+        pending = list(dict.fromkeys(retry_ids))
+        if not pending or attempt == GMAIL_BATCH_RETRY_ATTEMPTS:
+            break
+        time.sleep(GMAIL_BATCH_RETRY_DELAY_SECONDS * (2 ** attempt))
+    return results, pending
+
+
+def _batch_get(service, resource_ids, build_request, *, action, id_field, details):
+    """Fetch many resources through Gmail batch calls and return ``{resource_id: resource}``."""
+    results, _ = _batch_get_with_failures(
+        service,
+        resource_ids,
+        build_request,
+        action=action,
+        id_field=id_field,
+        details=details,
+    )
+    return results
+
+
+def _message_get_request(service, external_id, metadata_only=False):
+    """Build one ``messages.get`` request in full or metadata-only form."""
+    messages = service.users().messages()
+    if metadata_only:
+        return messages.get(
+            userId="me",
+            id=external_id,
+            format="metadata",
+            metadataHeaders=GMAIL_METADATA_HEADERS,
+        )
+    return messages.get(userId="me", id=external_id, format="full")
+
+
 def _load_draft_message(service, provider_draft_id):
     """Return the nested message payload for one Gmail draft."""
     draft_data = _get_draft_data(service, provider_draft_id)
@@ -474,12 +743,7 @@ def _replace_inline_cid_sources(raw_html, cid_sources):
             return match.group(0)
         return f"src={quote}{resolved}{quote}"
 
-    return re.sub(
-        r"""src\s*=\s*(['"])cid:([^'"]+)\1""",
-        replacer,
-        raw_html,
-        flags=re.IGNORECASE,
-    )
+    return _CID_SRC_PATTERN.sub(replacer, raw_html)
 
 
 def _extract_message_content(payload, service=None, message_id=None):
@@ -490,29 +754,28 @@ def _extract_message_content(payload, service=None, message_id=None):
     plain_text_parts = []
     html_parts = []
     inline_cid_sources = {}
-    stack = [payload]
 
     # Walk the MIME tree once and collect plain text, HTML, and inline image data.
-    while stack:
-        current = stack.pop()
-        children = current.get("parts") or []
-        if children:
-            stack.extend(reversed(children))
-
+    for current in _iter_parts(payload):
         mime_type = (current.get("mimeType") or "").lower()
         body_info = current.get("body") or {}
-        content_id = _normalize_cid(_extract_part_header(current, "Content-ID"))
-        content_type = _extract_part_header(current, "Content-Type") or mime_type
-        transfer_encoding = _extract_part_header(current, "Content-Transfer-Encoding")
-        content_bytes = _decode_body_bytes(body_info.get("data"))
-
+        part_headers = _header_index(current)
+        content_id = _normalize_cid(part_headers.get("content-id", ""))
+        content_type = part_headers.get("content-type") or mime_type
+        transfer_encoding = part_headers.get("content-transfer-encoding", "")
         attachment_id = body_info.get("attachmentId")
-        if not content_bytes and attachment_id:
-            should_fetch_attachment = mime_type.startswith("text/") or (
-                mime_type.startswith("image/") and content_id
-            )
-            if should_fetch_attachment:
-                content_bytes = _attachment_bytes(service, message_id, attachment_id)
+
+        if mime_type.startswith("image/") and content_id:
+            raw_data = body_info.get("data") or ""
+            if not raw_data and attachment_id:
+                raw_data = _attachment_data(service, message_id, attachment_id)
+            if raw_data:
+                inline_cid_sources[content_id] = _inline_image_data_uri(mime_type, raw_data)
+            continue
+
+        content_bytes = _decode_body_bytes(body_info.get("data"))
+        if not content_bytes and attachment_id and mime_type.startswith("text/"):
+            content_bytes = _attachment_bytes(service, message_id, attachment_id)
 
         if not content_bytes:
             continue
@@ -537,10 +800,6 @@ def _extract_message_content(payload, service=None, message_id=None):
             )
             continue
 
-        if mime_type.startswith("image/") and content_id:
-            encoded = base64.b64encode(content_bytes).decode("ascii")
-            inline_cid_sources[content_id] = f"data:{mime_type};base64,{encoded}"
-
     html_body = "\n".join(part for part in html_parts if part.strip()).strip()
     if html_body:
         html_body = _replace_inline_cid_sources(html_body, inline_cid_sources)
@@ -566,57 +825,54 @@ def _parse_addresses(raw_value):
     return ", ".join(parsed_addresses) if parsed_addresses else raw_value.strip()
 
 
-def _header_value(payload, name):
-    """Return a stripped header value from the top-level payload."""
-    return (_extract_header(payload, name) or "").strip()
-
-
-def _sender_looks_bulk(payload):
-    """Return whether the sender/header hints look like bulk mail."""
-    sender_value = _header_value(payload, "From").lower()
+def _sender_looks_bulk(headers):
+    """Return whether the sender/header hints in a ``_header_index`` dict look like bulk mail."""
+    sender_value = (headers.get("from") or "").strip().lower()
     if any(marker in sender_value for marker in BULK_SENDER_MARKERS):
         return True
 
-    precedence = _header_value(payload, "Precedence").lower()
+    precedence = (headers.get("precedence") or "").strip().lower()
     if precedence in {"bulk", "list", "junk"}:
         return True
 
-    if _header_value(payload, "List-Unsubscribe"):
+    if (headers.get("list-unsubscribe") or "").strip():
         return True
-    if _header_value(payload, "List-Id"):
+    if (headers.get("list-id") or "").strip():
         return True
 
-    auto_submitted = _header_value(payload, "Auto-Submitted").lower()
+    auto_submitted = (headers.get("auto-submitted") or "").strip().lower()
     if auto_submitted and auto_submitted != "no":
         return True
 
     return False
 
 
-def _labels_to_type(label_ids, payload=None):
-    """Map Gmail labels onto the app's mailbox type buckets."""
-    labels = set(label_ids or [])
-    if "DRAFT" in labels:
+def _label_mask(label_ids):
+    """Fold the system labels we care about into one ``_LABEL_*`` bitmask."""
+    mask = 0
+    for label_id in label_ids or ():
+        mask |= _LABEL_BITS.get(label_id, 0)
+    return mask
+
+
+def _labels_to_type(label_mask, headers=None):
+    """Map a ``_label_mask`` value onto the app's mailbox type buckets."""
+    if label_mask & _LABEL_DRAFT:
         return "draft"
-    if "SENT" in labels:
+    if label_mask & _LABEL_SENT:
         return "sent"
-    if "SPAM" in labels:
+    if label_mask & _LABEL_SPAM:
         return "junk"
-    if "UNREAD" in labels:
-        if payload and _sender_looks_bulk(payload):
+    if label_mask & _LABEL_UNREAD:
+        if headers and _sender_looks_bulk(headers):
             return "read-only"
         return "response-needed"
     return "read-only"
 
 
-def _labels_to_priority(label_ids):
-    """Map Gmail labels onto the app's local priority scale."""
-    labels = set(label_ids or [])
-    if "STARRED" in labels:
-        return 3
-    if "IMPORTANT" in labels:
-        return 2
-    return 1
+def _labels_to_priority(label_mask):
+    """Map a ``_label_mask`` value onto the app's local priority scale."""
+    return _PRIORITY_BY_MASK[label_mask & (_LABEL_STARRED | _LABEL_IMPORTANT)]
 
 
 def _received_at(internal_date):
@@ -629,34 +885,39 @@ def _received_at(internal_date):
         return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
 
 
-def _to_db_record(message, service=None, provider_draft_id=None):
+def _to_db_record(message, service=None, provider_draft_id=None, include_body=True):
     """Recipient database record.
     """
-    label_ids = set(message.get("labelIds") or [])
+    label_mask = _label_mask(message.get("labelIds"))
     # Skip TRASH rows because the local mailbox already mirrors them as deletes.
-    if "TRASH" in label_ids:
+    if label_mask & _LABEL_TRASH:
         return None
 
     payload = message.get("payload") or {}
-    body_text, body_html = _extract_message_content(
-        payload,
-        service=service,
-        message_id=message.get("id"),
-    )
-    body = (body_text or message.get("snippet") or "").strip()
+    headers = _header_index(payload)
+    if include_body:
+        body_text, body_html = _extract_message_content(
+            payload,
+            service=service,
+            message_id=message.get("id"),
+        )
+        body = (body_text or message.get("snippet") or "").strip()
+    else:
+        # Metadata payloads carry no MIME parts; None tells the upsert to keep stored bodies.
+        body, body_html = None, None
     return {
         "external_id": message.get("id"),
         "provider_draft_id": provider_draft_id,
         "thread_id": message.get("threadId"),
-        "title": repair_header_text(_extract_header(payload, "Subject") or "(No subject)"),
-        "sender": repair_header_text(_extract_header(payload, "From") or "unknown@unknown"),
-        "recipients": _parse_addresses(repair_header_text(_extract_header(payload, "To"))),
-        "cc": _parse_addresses(repair_header_text(_extract_header(payload, "Cc"))),
+        "title": repair_header_text(headers.get("subject") or "(No subject)"),
+        "sender": repair_header_text(headers.get("from") or "unknown@unknown"),
+        "recipients": _parse_addresses(repair_header_text(headers.get("to", ""))),
+        "cc": _parse_addresses(repair_header_text(headers.get("cc", ""))),
         "body": body,
         "body_html": body_html,
-        "type": _labels_to_type(label_ids, payload=payload),
-        "priority": _labels_to_priority(label_ids),
-        "is_read": "UNREAD" not in label_ids,
+        "type": _labels_to_type(label_mask, headers=headers),
+        "priority": _labels_to_priority(label_mask),
+        "is_read": not label_mask & _LABEL_UNREAD,
         "received_at": _received_at(message.get("internalDate")),
     }
 
@@ -754,6 +1015,151 @@ def _triage_email_with_ai(email_data, db_path):
     return True
 
 
+def _record_on_worker(message, include_body):
+    """Build one full record on a pool thread using that thread's own Gmail client."""
+    return _to_db_record(message, service=_get_service(), include_body=include_body)
+
+
+def _records_from_messages(service, messages):
+    """Convert ``(message, include_body)`` pairs into DB records, keeping their order."""
+    full_count = sum(1 for _, include_body in messages if include_body)
+    if full_count < 2 or SYNC_PARSE_WORKERS < 2:
+        converted = [
+            _to_db_record(message, service=service, include_body=include_body)
+            for message, include_body in messages
+        ]
+    else:
+        # Full payloads may fetch inline-image/text attachments one HTTPS call at a time;
+        # spreading them over workers overlaps that latency across messages.
+        converted = list(
+            _parse_executor().map(
+                lambda item: (
+                    _record_on_worker(*item)
+                    if item[1]
+                    else _to_db_record(item[0], include_body=False)
+                ),
+                messages,
+            )
+        )
+    return [record for record in converted if record]
+
+
+def _sync_message_page(service, page_ids, db_path, triage_budget):
+    """Fetch, mirror, and optionally triage one page of ids; return ``(synced, triaged, failed_ids)``.
+
+    ``failed_ids`` are messages that could not be fetched because of rate limits or transient
+    errors; the caller must not move the history cursor past them.
+    """
+    # Gmail message content never changes for a given id, so rows we already mirror
+    # only need labels/headers; only new ids download the full MIME tree.
+    known_ids = fetch_existing_external_ids(page_ids, db_path=db_path)
+    fetched, failed_ids = _batch_get_with_failures(
+        service,
+        page_ids,
+        lambda external_id: _message_get_request(service, external_id, external_id in known_ids),
+        action="sync_message_fetch",
+        id_field="external_id",
+        details="Gmail sync fetch failed.",
+    )
+    page_records = _records_from_messages(
+        service,
+        [
+            (fetched[external_id], external_id not in known_ids)
+            for external_id in page_ids
+            if fetched.get(external_id)
+        ],
+    )
+    if not page_records:
+        return 0, 0, failed_ids
+    email_ids = upsert_emails_from_provider(page_records, db_path=db_path)
+
+    # Only after a successful sync do we attempt optional AI triage, and only while
+    # triage budget remains for this run.
+    triaged = 0
+    for record, email_id in zip(page_records, email_ids):
+        if triaged >= triage_budget or not ai_triage_enabled():
+            break
+        try:
+            email_data = fetch_email_by_id(email_id, db_path=db_path)
+            if _should_ai_triage_email(email_data):
+                if _triage_email_with_ai(email_data, db_path):
+                    triaged += 1
+        except Exception as exc:
+            log_exception(
+                action_type="gmail_sync",
+                action="ai_triage",
+                error=exc,
+                component="gmail_service",
+                external_id=record.get("external_id"),
+                details="Gmail AI triage failed.",
+            )
+    return len(page_records), triaged, failed_ids
+
+
+def _current_history_id(service):
+    """Return the mailbox's current Gmail historyId, or None when it cannot be read."""
+    try:
+        profile = service.users().getProfile(userId="me").execute()
+    except Exception as exc:
+        log_exception(
+            action_type="gmail_sync",
+            action="profile_fetch",
+            error=exc,
+            component="gmail_service",
+            details="Gmail profile fetch failed.",
+        )
+        return None
+    history_id = (profile or {}).get("historyId")
+    return str(history_id) if history_id else None
+
+
+def _history_changes(service, start_history_id):
+    """Return ``(changed_message_ids, latest_history_id)`` since a cursor, or None to fall back."""
+    changed_ids = []
+    latest_history_id = start_history_id
+    page_token = None
+    while True:
+        try:
+            response = (
+                service.users()
+                .history()
+                .list(
+                    userId="me",
+                    startHistoryId=start_history_id,
+                    historyTypes=GMAIL_HISTORY_TYPES,
+                    pageToken=page_token,
+                )
+                .execute()
+            )
+        except Exception as exc:
+            # Expired cursors come back as 404; a full listing re-establishes the cursor.
+            log_exception(
+                action_type="gmail_sync",
+                action="history_list",
+                error=exc,
+                component="gmail_service",
+                details="Gmail history list failed; falling back to a full listing.",
+            )
+            return None
+        latest_history_id = str(response.get("historyId") or latest_history_id)
+        for history_record in response.get("history") or []:
+            for change_key in ("messagesAdded", "labelsAdded", "labelsRemoved"):
+                for change in history_record.get(change_key) or []:
+                    message_id = (change.get("message") or {}).get("id")
+                    if message_id:
+                        changed_ids.append(message_id)
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    return list(dict.fromkeys(changed_ids)), latest_history_id
+
+
+def _store_history_id(history_id, previous_history_id, db_path):
+    """Persist the sync cursor, skipping the write when it did not move."""
+    if history_id and history_id != previous_history_id:
+        set_app_setting(GMAIL_HISTORY_ID_SETTING_KEY, history_id, db_path=db_path)
+
+
 def sync_recent_emails(db_path=DB_DEFAULT, max_results=None):
     """Sync recent emails.
     """
@@ -782,9 +1188,59 @@ def sync_recent_emails(db_path=DB_DEFAULT, max_results=None):
     )
     triage_budget = max(0, min(10, int(AI_TRIAGE_PER_SYNC or 0)))
     triage_used = 0
-    page_token = None
     synced = 0
     visited = 0
+    failed_ids = []
+
+    # Steady-state polls ask Gmail only for messages added or relabelled since the last
+    # cursor, so unchanged messages cost nothing at all.
+    previous_history_id = get_app_setting(GMAIL_HISTORY_ID_SETTING_KEY, db_path=db_path)
+    delta = _history_changes(service, previous_history_id) if previous_history_id else None
+    if delta is not None and len(delta[0]) > target:
+        # A delta beyond this run's budget cannot be applied in full, and the cursor only
+        # moves once every change is mirrored, so resynchronise from the newest messages.
+        log_event(
+            action_type="gmail_sync",
+            action="history_over_budget",
+            status="skipped",
+            component="gmail_service",
+            changed=len(delta[0]),
+            max_results=target,
+        )
+        delta = None
+    if delta is not None:
+        changed_ids, latest_history_id = delta
+        for start in range(0, len(changed_ids), GMAIL_BATCH_MAX_REQUESTS):
+            page_synced, page_triaged, page_failed = _sync_message_page(
+                service,
+                changed_ids[start:start + GMAIL_BATCH_MAX_REQUESTS],
+                db_path,
+                triage_budget - triage_used,
+            )
+            synced += page_synced
+            triage_used += page_triaged
+            failed_ids.extend(page_failed)
+        visited = len(changed_ids)
+        # Keep the old cursor while any change is unfetched so the next poll replays it.
+        if not failed_ids:
+            _store_history_id(latest_history_id, previous_history_id, db_path)
+        log_event(
+            action_type="gmail_sync",
+            action="sync_recent_complete",
+            status="ok" if not failed_ids else "partial",
+            component="gmail_service",
+            mode="history",
+            synced=synced,
+            visited=visited,
+            failed=len(failed_ids),
+            triage_used=triage_used,
+        )
+        return synced
+
+    # Read the cursor before listing so changes that land mid-sync are replayed next time.
+    start_history_id = _current_history_id(service)
+    listing_complete = True
+    page_token = None
 
     # We page through lightweight message ids first, then spend the heavier work on
     # fetching and triaging only the rows that actually make it through sync.
@@ -813,62 +1269,58 @@ def sync_recent_emails(db_path=DB_DEFAULT, max_results=None):
                 details="Gmail message list failed.",
                 db_path=db_path,
             )
+            listing_complete = False
             break
         messages = response.get("messages") or []
         if not messages:
             break
 
-        # Sync each message id immediately; only after a successful sync do we attempt
-        # optional AI triage, and only while triage budget remains for this run.
+        page_ids = []
         for item in messages:
             visited += 1
-            external_id = item.get("id")
-            if not external_id:
-                continue
-            synced_record = sync_message_by_external_id(
-                external_id,
-                db_path=db_path,
-                service=service,
-            )
-            if synced_record:
-                synced += 1
-                if triage_used < triage_budget and ai_triage_enabled():
-                    try:
-                        email_id = synced_record.get("id")
-                        email_data = fetch_email_by_id(email_id, db_path=db_path)
-                        if _should_ai_triage_email(email_data):
-                            if _triage_email_with_ai(email_data, db_path):
-                                triage_used += 1
-                    except Exception as exc:
-                        log_exception(
-                            action_type="gmail_sync",
-                            action="ai_triage",
-                            error=exc,
-                            component="gmail_service",
-                            external_id=external_id,
-                            details="Gmail AI triage failed.",
-                        )
+            if item.get("id"):
+                page_ids.append(item["id"])
             if visited >= target:
                 break
+
+        page_synced, page_triaged, page_failed = _sync_message_page(
+            service,
+            page_ids,
+            db_path,
+            triage_budget - triage_used,
+        )
+        synced += page_synced
+        triage_used += page_triaged
+        failed_ids.extend(page_failed)
         # Advance to the next page token from Gmail; missing token means we reached
         # the end of the result set and should finish this sync cycle.
         page_token = response.get("nextPageToken")
         if not page_token:
             break
+    # Leaving the cursor where it was makes the next poll list or replay again, retrying failures.
+    if listing_complete and not failed_ids:
+        _store_history_id(start_history_id, previous_history_id, db_path)
     # Emit one completion event with counters so downstream logs can track sync depth
     # and how much AI triage work happened within this invocation.
     log_event(
         action_type="gmail_sync",
         action="sync_recent_complete",
-        status="ok",
+        status="ok" if listing_complete and not failed_ids else "partial",
         component="gmail_service",
+        mode="list",
         synced=synced,
         visited=visited,
+        failed=len(failed_ids),
         triage_used=triage_used,
     )
     return synced
 
 
+def background_sync_due():
+    """Return whether the rate limit would let a non-forced background sync start now."""
+    return time.time() - GMAIL_SYNC_STATE.last_sync_at >= SYNC_INTERVAL_SECONDS
+
+
 def trigger_background_sync(db_path=DB_DEFAULT, force=False, max_results=None):
     """Trigger background sync.
     """
@@ -894,8 +1346,38 @@ def trigger_background_sync(db_path=DB_DEFAULT, force=False, max_results=None):
         )
         return False
 
-    def _worker():
-        """Run one background sync cycle and always release the sync lock afterward."""
+    log_event(
+        action_type="gmail_sync",
+        action="background_sync_start",
+        status="start",
+        component="gmail_service",
+        force=bool(force),
+        max_results=max_results,
+    )
+    # Hand the job to the single sync worker instead of spawning a thread per sync,
+    # so its thread-local Gmail service stays warm between runs.
+    sync_state.pending = (db_path, max_results)
+    if sync_state.worker is None or not sync_state.worker.is_alive():
+        sync_state.worker = threading.Thread(
+            target=_background_sync_worker,
+            args=(sync_state,),
+            name="gmail-sync",
+            daemon=True,
+        )
+        sync_state.worker.start()
+    sync_state.wake.set()
+    return True
+
+
+def _background_sync_worker(sync_state):
+    """Run queued sync jobs forever, releasing the sync lock after each one."""
+    while True:
+        sync_state.wake.wait()
+        sync_state.wake.clear()
+        job, sync_state.pending = sync_state.pending, None
+        if job is None:
+            continue
+        db_path, max_results = job
         # Manage the worker lifecycle so asynchronous UI polling stays consistent.
         try:
             sync_recent_emails(db_path=db_path, max_results=max_results)
@@ -917,25 +1399,15 @@ def trigger_background_sync(db_path=DB_DEFAULT, force=False, max_results=None):
         finally:
             sync_state.lock.release()
 
-    log_event(
-        action_type="gmail_sync",
-        action="background_sync_start",
-        status="start",
-        component="gmail_service",
-        force=bool(force),
-        max_results=max_results,
-    )
-    threading.Thread(target=_worker, daemon=True).start()
-    return True
-
 
 def _modify_labels(service, external_id, add_labels=None, remove_labels=None):
     """Apply Gmail label mutations to one message."""
+    # Callers pass one or two labels; dict.fromkeys dedupes without sorting.
     body = {}
     if add_labels:
-        body["addLabelIds"] = sorted(set(add_labels))
+        body["addLabelIds"] = list(dict.fromkeys(add_labels))
     if remove_labels:
-        body["removeLabelIds"] = sorted(set(remove_labels))
+        body["removeLabelIds"] = list(dict.fromkeys(remove_labels))
     if not body:
         return True
 
@@ -1215,13 +1687,28 @@ def sync_drafts_from_gmail(db_path=DB_DEFAULT, max_results=50):
         if not draft_refs:
             break
 
-        # Fetch each draft payload and mirror it into local storage as a draft row.
+        page_draft_ids = []
         for entry in draft_refs:
             visited += 1
-            provider_draft_id = entry.get("id")
-            if not provider_draft_id:
-                continue
-            draft_data = _get_draft_data(service, provider_draft_id)
+            if entry.get("id"):
+                page_draft_ids.append(entry["id"])
+            if visited >= target:
+                break
+
+        # Fetch the page's draft payloads in batch calls, then mirror them in one transaction.
+        fetched = _batch_get(
+            service,
+            page_draft_ids,
+            lambda provider_draft_id: service.users().drafts().get(
+                userId="me", id=provider_draft_id, format="full"
+            ),
+            action="draft_fetch",
+            id_field="provider_draft_id",
+            details="Gmail draft fetch failed.",
+        )
+        page_records = []
+        for provider_draft_id in page_draft_ids:
+            draft_data = fetched.get(provider_draft_id)
             if not draft_data:
                 continue
 
@@ -1235,11 +1722,11 @@ def sync_drafts_from_gmail(db_path=DB_DEFAULT, max_results=50):
                 continue
             record["type"] = "draft"
             record["is_read"] = True
-            upsert_email_from_provider(record, db_path=db_path)
-            synced += 1
+            page_records.append(record)
 
-            if visited >= target:
-                break
+        if page_records:
+            upsert_emails_from_provider(page_records, db_path=db_path)
+            synced += len(page_records)
 
         # Advance pagination; if there is no next token, we are at the end of the drafts list.
         page_token = response.get("nextPageToken")
@@ -3,6 +3,8 @@
 import os
 import threading
 import time
+from hashlib import blake2b
+from operator import itemgetter
 from urllib.parse import parse_qsl, urlencode, urlsplit
 
 from .db import count_mailbox_emails, fetch_mailbox_ids, fetch_mailbox_page
@@ -12,14 +14,16 @@ from .gmail_service import sync_drafts_from_gmail
 # This module keeps list-view behavior centralized so routes only need to ask
 # for "the draft tab" or "the archive tab" instead of rebuilding query rules.
 HIDDEN_FROM_MAIN_LIST_TYPES = {"sent", "draft"}
-VALID_SORTS = {
-    "date_desc",
-    "date_asc",
-    "priority_desc",
-    "priority_asc",
-    "unread_first",
-    "read_first",
-}
+VALID_SORTS = frozenset(
+    {
+        "date_desc",
+        "date_asc",
+        "priority_desc",
+        "priority_asc",
+        "unread_first",
+        "read_first",
+    }
+)
 # Per-tab rules for live mailbox pages and API views.
 LIVE_LIST_CONFIGS = {
     "all": {
@@ -210,55 +214,59 @@ def _date_number(date_text):
     return dt.toordinal() * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
 
 
-def _email_sort_key(email, sort_code):
-    """Return the tuple used for stable mailbox sorting."""
+def _decorated_email(email):
+    """Return ``(date, -date, priority, -priority, is_read, is_unread, email)`` for sorting."""
     date_num = _date_number(email.get("date"))
     priority = int(email.get("priority") or 0)
     is_read = bool(email.get("is_read"))
-
-    # Turn the requested sort mode into one tuple so merge sort can stay generic.
-    if sort_code == "date_asc":
-        return (date_num,)
-    if sort_code == "priority_desc":
-        return (-priority, -date_num)
-    if sort_code == "priority_asc":
-        return (priority, -date_num)
-    if sort_code == "unread_first":
-        return (is_read, -date_num)
-    if sort_code == "read_first":
-        return (not is_read, -date_num)
-    return (-date_num,)
+    return (date_num, -date_num, priority, -priority, is_read, not is_read, email)
+
+
+# Each sort mode picks fields out of the decorated tuple, so ordering runs on C-level
+# itemgetter keys with no per-row branching on the sort code.
+_SORT_KEY_GETTERS = {
+    "date_desc": itemgetter(1),
+    "date_asc": itemgetter(0),
+    "priority_desc": itemgetter(3, 1),
+    "priority_asc": itemgetter(2, 1),
+    "unread_first": itemgetter(4, 1),
+    "read_first": itemgetter(5, 1),
+}
+_DEFAULT_SORT_KEY = _SORT_KEY_GETTERS["date_desc"]
 
 
 def sort_emails(emails, sort_code):
     """Sort mailbox rows using Python's stable built-in sort."""
-    if sort_code not in VALID_SORTS:
-        sort_code = "date_desc"
+    if len(emails) < 2:
+        # Empty lists and single hits skip date parsing and decoration entirely.
+        return list(emails)
+    key_getter = _SORT_KEY_GETTERS.get(sort_code, _DEFAULT_SORT_KEY)
 
-    # The key function stays centralized above, while the runtime gets to rely
-    # on CPython's well-tested stable sort instead of our own merge-sort copy.
-    return sorted(list(emails), key=lambda email: _email_sort_key(email, sort_code))
+    # Decorate each row once, let CPython's stable sort order the tuples, then strip
+    # the decoration back off.
+    decorated = [_decorated_email(email) for email in emails]
+    decorated.sort(key=key_getter)
+    return [item[-1] for item in decorated]
 
 
 def emails_fingerprint(emails, *, total_count=None, page=None):
     """Return a light hash string for live list refresh checks."""
-    rows = []
-    rows.append(str(max(0, int(total_count or 0))))
-    rows.append(str(max(1, int(page or 1))))
+    # The live list only compares fingerprints for equality, so a short digest replaces
+    # shipping every title back in each poll response and page attribute.
+    digest = blake2b(digest_size=16)
+    digest.update(f"{max(0, int(total_count or 0))}|{max(1, int(page or 1))}".encode())
     for email in emails:
-        rows.append(
-            ":".join(
-                [
-                    str(email.get("id") or ""),
-                    str(int(bool(email.get("is_read")))),
-                    str(email.get("type") or ""),
-                    str(email.get("date") or ""),
-                    str(int(email.get("priority") or 0)),
-                    str(email.get("title") or ""),
-                ]
-            )
+        digest.update(
+            (
+                f"|{email.get('id') or ''}"
+                f":{int(bool(email.get('is_read')))}"
+                f":{email.get('type') or ''}"
+                f":{email.get('date') or ''}"
+                f":{int(email.get('priority') or 0)}"
+                f":{email.get('title') or ''}"
+            ).encode()
         )
-    return "|".join(rows)
+    return digest.hexdigest()
 
 
 def build_mailbox_context(
@@ -2,6 +2,7 @@
 import atexit
 import base64
 import hashlib
+import http.client
 import ipaddress
 import json
 import os
@@ -10,8 +11,8 @@ import re
 import threading
 import time
 import urllib.error
-import urllib.request
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 from uuid import uuid4
@@ -23,6 +24,10 @@ except ImportError:  # Optional dependency for real HTML screenshots.
     PlaywrightError = RuntimeError
     PlaywrightTimeoutError = RuntimeError
     sync_playwright = None
+try:
+    import orjson
+except ImportError:  # Optional speedup for Ollama request/response JSON.
+    orjson = None
 from .db import (
     fetch_email_by_id,
     get_user_display_name,
@@ -52,6 +57,7 @@ VISION_BROWSER_WAIT_MS_DEFAULT = 750
 VISION_RENDER_VIEWPORT_WIDTH_DEFAULT = 1365
 VISION_RENDER_PAGE_HEIGHT_DEFAULT = 1800
 VISION_RENDER_CACHE_MAX_ITEMS = 128
+CHAT_RESPONSE_CACHE_MAX_ITEMS = 512
 VALID_CATEGORIES = {"urgent", "informational", "junk"}
 VALID_EMAIL_TYPES = {"response-needed", "read-only", "junk", "junk-uncertain"}
 LONG_OLLAMA_TASKS = {
@@ -94,6 +100,11 @@ LOCALHOST_NAMES = {"localhost"}
 OLLAMA_TAGS_CACHE_TTL_SECONDS = 300.0
 OLLAMA_TAGS_CACHE = {"fetched_at": 0.0, "models": ()}
 OLLAMA_TAGS_LOCK = threading.Lock()
+# Per-thread keep-alive connections to the local Ollama server, keyed by host:port.
+OLLAMA_HTTP_STATE = threading.local()
+# Responses to deterministic (temperature 0) chat payloads, keyed by a payload digest.
+CHAT_RESPONSE_CACHE = {}
+CHAT_RESPONSE_CACHE_LOCK = threading.Lock()
 VISION_RENDER_CACHE = {}
 VISION_RENDER_CACHE_LOCK = threading.Lock()
 VISION_RENDER_REQUEST_QUEUE = queue.Queue()
@@ -683,6 +694,7 @@ TRANSACTIONAL_HAM_MARKERS = (
 )
 EMAIL_ADDRESS_PATTERN = re.compile(r"([a-z0-9._%+\-]+@[a-z0-9.\-]+\.[a-z]{2,})")
 SUMMARY_LIST_MARKER_PATTERN = re.compile(r"^(?:[-*]|\d+[.)])\s+")
+FENCED_JSON_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(\{[\s\S]*?\})\s*```")
 # Keep deterministic summaries from being clipped; sentence-count controls still keep them readable.
 SUMMARY_MAX_CHARS = 4800
 DRAFT_MIN_CHARS = 20
@@ -799,6 +811,140 @@ def _api_url():
     return value or OLLAMA_API_URL_DEFAULT
 
 
+def _json_loads(raw):
+    """Decode JSON text or bytes; orjson's decode error subclasses json.JSONDecodeError."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _json_dumps_bytes(value):
+    """Encode a JSON request body as UTF-8 bytes."""
+    return orjson.dumps(value) if orjson is not None else json.dumps(value).encode("utf-8")
+
+
+def _ollama_connection(parsed_url, timeout):
+    """Return this thread's keep-alive connection for an Ollama URL and whether it was reused."""
+    connections = getattr(OLLAMA_HTTP_STATE, "connections", None)
+    if connections is None:
+        connections = OLLAMA_HTTP_STATE.connections = {}
+    connection = connections.get(parsed_url.netloc)
+    if connection is None:
+        connection = http.client.HTTPConnection(
+            parsed_url.hostname,
+            parsed_url.port,
+            timeout=timeout,
+        )
+        connections[parsed_url.netloc] = connection
+    reused = connection.sock is not None
+    connection.timeout = timeout
+    if reused:
+        connection.sock.settimeout(timeout)
+    return connection, reused
+
+
+def _ollama_open(url, *, data=None, timeout=None):
+    """Send one GET (or JSON POST when ``data`` is given) and return ``(connection, response)``."""
+    parsed_url = urlparse(url)
+    path = parsed_url.path or "/"
+    if parsed_url.query:
+        path = f"{path}?{parsed_url.query}"
+    method = "GET" if data is None else "POST"
+    headers = {} if data is None else {"Content-Type": "application/json"}
+    for attempt in range(2):
+        connection, reused = _ollama_connection(parsed_url, timeout)
+        try:
+            connection.request(method, path, body=data, headers=headers)
+            response = connection.getresponse()
+        except (http.client.HTTPException, OSError) as exc:
+            connection.close()
+            # The server may drop an idle keep-alive socket; retry once on a fresh one.
+            if reused and attempt == 0 and not isinstance(exc, TimeoutError):
+                continue
+            raise
+        if response.status >= 400:
+            response.read()
+            connection.close()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        return connection, response
+
+
+def _ollama_http_request(url, *, data=None, timeout=None):
+    """Send one request to Ollama and return the full response body bytes."""
+    connection, response = _ollama_open(url, data=data, timeout=timeout)
+    try:
+        raw = response.read()
+    except (http.client.HTTPException, OSError):
+        connection.close()
+        raise
+    if response.will_close:
+        connection.close()
+    return raw
+
+
+def _json_object_close_detector():
+    """Return a ``feed(text) -> bool`` that reports when the first JSON object closes."""
+    state = {"depth": 0, "started": False, "in_string": False, "escaped": False}
+
+    def feed(text):
+        for char in text:
+            if state["in_string"]:
+                if state["escaped"]:
+                    state["escaped"] = False
+                elif char == "\\":
+                    state["escaped"] = True
+                elif char == '"':
+                    state["in_string"] = False
+            elif char == '"':
+                state["in_string"] = state["started"]
+            elif char == "{":
+                state["started"] = True
+                state["depth"] += 1
+            elif char == "}" and state["started"]:
+                state["depth"] -= 1
+                if state["depth"] == 0:
+                    return True
+        return False
+
+    return feed
+
+
+def _ollama_stream_json_content(url, *, data, timeout=None):
+    """Stream a chat response and stop reading once the first JSON object is complete.
+
+    Returns ``(content, complete)``; ``complete`` is false when the stream ended
+    before Ollama reported ``done`` or the object closed.
+    """
+    connection, response = _ollama_open(url, data=data, timeout=timeout)
+    object_closed = _json_object_close_detector()
+    pieces = []
+    finished = False
+    closed = False
+    try:
+        # Ollama streams one JSON chunk per line; closing early cancels the generation.
+        for line in response:
+            if not line.strip():
+                continue
+            try:
+                chunk = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            piece = (chunk.get("message") or {}).get("content") or ""
+            pieces.append(piece)
+            if chunk.get("done"):
+                finished = True
+                break
+            if object_closed(piece):
+                closed = True
+                break
+    except (http.client.HTTPException, OSError):
+        connection.close()
+        raise
+    if not finished or response.will_close:
+        connection.close()
+    else:
+        response.read()
+    return "".join(pieces), finished or closed
+
+
 def _env_flag(env_names, default=False):
     """Return the first boolean-like env var value from the provided names."""
     truthy = {"1", "true", "yes", "on"}
@@ -889,10 +1035,9 @@ def _available_ollama_models(api_urls=None, force_refresh=False):
     models = ()
     tags_timeout = _tags_timeout_seconds()
     for tags_url in _tags_url_candidates(api_urls=api_urls):
-        request_obj = urllib.request.Request(tags_url, method="GET")
         try:
-            with urllib.request.urlopen(request_obj, timeout=tags_timeout) as response:
-                parsed = json.loads(response.read().decode("utf-8"))
+            raw = _ollama_http_request(tags_url, timeout=tags_timeout)
+            parsed = _json_loads(raw)
             models = tuple(
                 model.get("name")
                 for model in (parsed.get("models") or [])
@@ -900,7 +1045,7 @@ def _available_ollama_models(api_urls=None, force_refresh=False):
             )
             if models:
                 break
-        except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError, OSError, json.JSONDecodeError):
+        except (http.client.HTTPException, OSError, json.JSONDecodeError):
             continue
 
     with OLLAMA_TAGS_LOCK:
@@ -1875,7 +2020,14 @@ def _endpoint_allowed():
     """Endpoint allowed.
     """
     # Shared helper for this file.
-    parsed = urlparse(_api_url())
+    return _api_url_allowed(_api_url())
+
+
+@lru_cache(maxsize=8)
+def _api_url_allowed(api_url):
+    """Return whether one configured API URL is a plain-HTTP loopback endpoint."""
+    # Keyed by the URL so env changes still apply while detail pages skip re-parsing it.
+    parsed = urlparse(api_url)
     if parsed.scheme != "http":
         return False
     return _is_loopback_host(parsed.hostname)
@@ -6830,11 +6982,14 @@ def _extract_json_block(text):
     stripped = str(text or "").strip()
     if stripped.startswith("{") and stripped.endswith("}"):
         return stripped
-    fenced_match = re.search(r"```(?:json)?\s*(\{[\s\S]*?\})\s*```", stripped)
-    if fenced_match:
-        return fenced_match.group(1).strip()
-    match = re.search(r"\{[\s\S]*\}", stripped)
-    return match.group(0).strip() if match else None
+    if "```" in stripped:
+        fenced_match = FENCED_JSON_BLOCK_PATTERN.search(stripped)
+        if fenced_match:
+            return fenced_match.group(1).strip()
+    # Take the outermost span from the first "{" through the last "}".
+    start = stripped.find("{")
+    end = stripped.rfind("}")
+    return stripped[start:end + 1].strip() if 0 <= start < end else None
 
 
 def _parse_bool(value):
@@ -6917,6 +7072,25 @@ def _normalize_classification(raw_value):
     return normalized
 
 
+def _cached_chat_response(cache_key):
+    """Return a cached chat response for a payload digest, refreshing its LRU position."""
+    with CHAT_RESPONSE_CACHE_LOCK:
+        cached = CHAT_RESPONSE_CACHE.pop(cache_key, None)
+        if cached is not None:
+            CHAT_RESPONSE_CACHE[cache_key] = cached
+        return cached
+
+
+def _store_chat_response(cache_key, content):
+    """Remember a chat response and evict the least recently used entries."""
+    with CHAT_RESPONSE_CACHE_LOCK:
+        CHAT_RESPONSE_CACHE.pop(cache_key, None)
+        CHAT_RESPONSE_CACHE[cache_key] = content
+        while len(CHAT_RESPONSE_CACHE) > CHAT_RESPONSE_CACHE_MAX_ITEMS:
+            oldest_key = next(iter(CHAT_RESPONSE_CACHE))
+            CHAT_RESPONSE_CACHE.pop(oldest_key, None)
+
+
 def _call_ollama(
     task,
     messages,
@@ -6924,9 +7098,12 @@ def _call_ollama(
     temperature=0.1,
     num_predict=320,
     model_task=None,
+    stop_at_json=False,
 ):
     """Call Ollama chat API and return response content or None on failure."""
-    # Send one non-streaming chat request to Ollama and return the model text.
+    # Send one chat request to Ollama and return the model text. JSON-only tasks pass
+    # ``stop_at_json`` to stream and hang up once the object closes, skipping any
+    # trailing tokens the model would otherwise generate.
     started_at = time.perf_counter()
     api_urls = _api_url_candidates()
     model_selection = _resolve_model_selection(task=model_task or task, api_urls=api_urls)
@@ -6992,24 +7169,44 @@ def _call_ollama(
     payload = {
         "model": model_name,
         "messages": messages,
-        "stream": False,
+        "stream": bool(stop_at_json),
         "options": ollama_options,
     }
     if keep_alive:
         payload["keep_alive"] = keep_alive
-    body = json.dumps(payload).encode("utf-8")
+    body = _json_dumps_bytes(payload)
+    # Greedy decoding makes identical payloads return identical text, so repeated
+    # classify/plan calls for the same email and model skip the round trip.
+    cache_key = hashlib.blake2b(body, digest_size=16).hexdigest() if not temperature else None
+    if cache_key:
+        cached_content = _cached_chat_response(cache_key)
+        if cached_content is not None:
+            _log_action(
+                task=task,
+                status="call_success",
+                email_id=email_id,
+                detail=f"chars={len(cached_content)} cached=1",
+            )
+            return cached_content
     raw = None
+    streamed_content = None
+    stream_complete = True
     last_error = None
     for candidate_url in api_urls:
-        request_obj = urllib.request.Request(
-            candidate_url,
-            data=body,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
         try:
-            with urllib.request.urlopen(request_obj, timeout=request_timeout) as response:
-                raw = response.read().decode("utf-8")
+            if stop_at_json:
+                streamed_content, stream_complete = _ollama_stream_json_content(
+                    candidate_url,
+                    data=body,
+                    timeout=request_timeout,
+                )
+                raw = b""
+            else:
+                raw = _ollama_http_request(
+                    candidate_url,
+                    data=body,
+                    timeout=request_timeout,
+                )
             if candidate_url != api_urls[0]:
                 _log_action(
                     task=task,
@@ -7018,7 +7215,7 @@ def _call_ollama(
                     detail=f"ollama_endpoint_fallback_success url={candidate_url}",
                 )
             break
-        except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError, OSError) as exc:
+        except (http.client.HTTPException, OSError) as exc:
             last_error = exc
             continue
 
@@ -7034,13 +7231,15 @@ def _call_ollama(
         )
         return None
 
-    try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        _log_action(task=task, status="error", email_id=email_id, detail=f"json_decode_failed: {exc}")
-        return None
-
-    content = ((parsed.get("message") or {}).get("content") or "").strip()
+    if streamed_content is not None:
+        content = streamed_content.strip()
+    else:
+        try:
+            parsed = _json_loads(raw)
+        except json.JSONDecodeError as exc:
+            _log_action(task=task, status="error", email_id=email_id, detail=f"json_decode_failed: {exc}")
+            return None
+        content = ((parsed.get("message") or {}).get("content") or "").strip()
     if not content:
         _log_action(task=task, status="error", email_id=email_id, detail="empty_response_content")
         return None
@@ -7051,6 +7250,10 @@ def _call_ollama(
         email_id=email_id,
         detail=f"chars={len(content)} elapsed_ms={int((time.perf_counter() - started_at) * 1000)}",
     )
+    # A stream cut short still returns its text for parsing, but only complete
+    # replies are worth replaying for the next identical payload.
+    if cache_key and stream_complete:
+        _store_chat_response(cache_key, content)
     return content
 
 
@@ -7106,6 +7309,7 @@ def classify_email(email_data, email_id=None):
         email_id=email_id,
         temperature=0.0,
         num_predict=_num_predict_for_task("classify", CLASSIFY_NUM_PREDICT_DEFAULT),
+        stop_at_json=True,
     )
     if not response_text:
         _log_performance(
@@ -7130,7 +7334,7 @@ def classify_email(email_data, email_id=None):
         )
         return heuristic
     try:
-        parsed = json.loads(json_block)
+        parsed = _json_loads(json_block)
     except json.JSONDecodeError as exc:
         _log_action(task="classify", status="error", email_id=email_id, detail=f"invalid_json: {exc}")
         _log_performance(
@@ -7695,6 +7899,7 @@ def _extract_reply_plan(email_data, email_id=None):
         email_id=email_id,
         temperature=0.0,
         num_predict=_num_predict_for_task("draft_plan", 180),
+        stop_at_json=True,
     )
     if not response_text:
         if isinstance(email_data, dict):
@@ -7707,7 +7912,7 @@ def _extract_reply_plan(email_data, email_id=None):
             email_data["_reply_plan_cache"] = heuristic_plan
         return heuristic_plan
     try:
-        parsed = json.loads(json_block)
+        parsed = _json_loads(json_block)
     except json.JSONDecodeError:
         if isinstance(email_data, dict):
             email_data["_reply_plan_cache"] = heuristic_plan
@@ -1,12 +1,32 @@
 """Flask routes for mailbox pages, compose flows, and lightweight JSON APIs."""
 
-from flask import Blueprint, render_template, request, redirect, url_for, abort, Response, jsonify
+from flask import (
+    Blueprint,
+    render_template,
+    request,
+    redirect,
+    url_for,
+    abort,
+    Response,
+    jsonify,
+    g,
+    make_response,
+)
 import os
+import re
 import threading
+from functools import lru_cache
 from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # Optional speedup for the live-list polling payload.
+    orjson = None
+
 from .db import (
+    READ_CACHE,
     fetch_email_by_id,
-    fetch_emails_by_ids,
+    fetch_email_states_by_ids,
     fetch_email_by_provider_draft_id,
     fetch_thread_emails,
     get_user_display_name,
@@ -15,12 +35,14 @@ from .db import (
     set_user_display_name,
     delete_email as db_delete_email,
     mark_read,
+    mark_read_many,
     update_draft,
     create_reply_email,
     save_local_draft,
     create_local_sent_email,
 )
 from .gmail_service import (
+    background_sync_due,
     delete_draft_message,
     fetch_draft_attachment_metadata,
     fetch_draft_attachments,
@@ -63,6 +85,16 @@ from .mailbox import (
 main = Blueprint("main", __name__)
 LOCAL_USER_EMAIL = (os.getenv("LOCAL_USER_EMAIL") or "you@example.com").strip() or "you@example.com"
 
+# Pages that poll or run their own async work never trigger the page-load sync.
+PAGE_LOAD_SYNC_SKIPPED_ENDPOINTS = frozenset(
+    {
+        "main.about",
+        "main.compose",
+        "main.email",
+        "main.list_emails_api",
+        "main.ai_task_status",
+    }
+)
 # Mailbox type rules shared by several routes.
 NON_MAIN_TYPES = {"sent", "draft"}
 ALLOWED_EMAIL_TYPES = {"response-needed", "read-only", "junk", "junk-uncertain"}
@@ -76,6 +108,21 @@ MAILBOX_PAGE_ROUTES = (
     ("/drafts", "drafts", "drafts.html", "draft"),
     ("/archive", "archive", "archive.html", "archived"),
 )
+# One anchored pattern accepts local list-page targets and captures path and query.
+# Browsers read "/\host" like "//host" and drop tabs/newlines inside URLs, so those are
+# rejected along with detail pages ("/email/..."); any fragment is matched and dropped.
+LOCAL_NEXT_URL_PATTERN = re.compile(
+    r"(/(?![/\\]|email/)[^?#\x00-\x1f\x7f]*)"
+    r"(?:\?([^#\x00-\x1f\x7f]*))?"
+    r"(?:#[^\x00-\x1f\x7f]*)?"
+)
+# Read-cache generations restart at zero with the process, so a per-process seed keeps
+# ETags handed out before a restart from matching new pages.
+MAILBOX_PAGE_ETAG_SEED = os.urandom(4).hex()
+# Live polls mostly re-render identical rows, so recent row markup is kept by fingerprint.
+LIST_ROWS_HTML_CACHE = {}
+LIST_ROWS_HTML_CACHE_LOCK = threading.Lock()
+LIST_ROWS_HTML_CACHE_MAX_ITEMS = 64
 
 
 @main.app_context_processor
@@ -88,7 +135,14 @@ def _normalize_addresses(raw_value):
     """Clean up semicolons and whitespace so email addresses use a consistent comma-separated format."""
     if raw_value is None:
         return None
-    text = str(raw_value).replace(";", ",")
+    # JSON payloads may carry non-string values, so only the str() form is used as the cache key.
+    return _normalize_address_text(str(raw_value))
+
+
+@lru_cache(maxsize=2048)
+def _normalize_address_text(text):
+    """Normalize one address string; reply posts repeat the same sender/recipient values."""
+    text = text.replace(";", ",")
     cleaned = [part.strip() for part in text.split(",") if part.strip()]
     return ", ".join(cleaned) if cleaned else None
 
@@ -174,7 +228,9 @@ def _set_message_read_state_async(external_id, read=True):
 
 def _current_list_url():
     """Return the current page's full URL path so redirects can send the user back to where they were."""
-    return request.full_path[:-1] if request.full_path.endswith("?") else request.full_path
+    # full_path always appends "?", so only add the query string when there is one.
+    query_string = request.query_string
+    return f"{request.path}?{query_string.decode()}" if query_string else request.path
 
 
 def _list_query_state():
@@ -187,26 +243,26 @@ def _list_query_state():
 
 def _safe_next_url(raw_next):
     """Return a local in-app URL for redirects."""
-    fallback = url_for("main.allemails")
     candidate = (raw_next or "").strip()
-    if not candidate:
-        return fallback
-    if not candidate.startswith("/"):
-        return fallback
-
-    # Parse this once and reject external or absolute targets.
-    parsed = urlsplit(candidate)
-    if parsed.scheme or parsed.netloc:
-        return fallback
-    if parsed.path.startswith("/email/"):
+    # A rooted path that is not "//" or "/\" has no scheme or host, so no urlsplit is needed.
+    match = LOCAL_NEXT_URL_PATTERN.fullmatch(candidate)
+    if match:
         # Keep people on list-style pages after POST actions.
-        return fallback
-    return f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+        path, query = match.groups()
+        return f"{path}?{query}" if query else path
+    # Only build the fallback URL when it is actually needed.
+    return url_for("main.allemails")
 
 
 def _next_url_from_request():
     """Read the 'next' redirect target from the form or query string, falling back to the main mailbox."""
-    return _safe_next_url(request.form.get("next") or request.args.get("next"))
+    # Validated lazily and at most once per request; GET pages that never redirect skip it.
+    next_url = g.get("next_url")
+    if next_url is None:
+        next_url = g.next_url = _safe_next_url(
+            request.form.get("next") or request.args.get("next")
+        )
+    return next_url
 
 
 def _render_mailbox_page(
@@ -217,6 +273,7 @@ def _render_mailbox_page(
 ):
     """Shared renderer for all mailbox tab pages: fetches emails, builds pagination, and returns the rendered template."""
     sort_code, search_query, page, current_list_url = _list_query_state()
+    generation = READ_CACHE.generation
     emails, empty_message, total_count, current_page = _fetch_live_list_emails(
         list_view,
         search_query=search_query,
@@ -226,6 +283,16 @@ def _render_mailbox_page(
     )
     if emails is None:
         abort(404)
+    # Every page input lives in the DB or the URL, so an unchanged generation means an
+    # unchanged page. Skip the ETag when a write (e.g. draft sync) landed mid-fetch.
+    # The generation only counts writes made through this process's db_session, so this
+    # assumes one app process owns the database (run.py's server plus its sync thread);
+    # a second worker or an outside script writing the file would get stale 304s.
+    etag = None
+    if READ_CACHE.generation == generation:
+        etag = f"{MAILBOX_PAGE_ETAG_SEED}-{generation}"
+        if request.if_none_match.contains(etag):
+            return _revalidated_mailbox_response(Response(status=304), etag)
     pagination = build_mailbox_pagination(
         current_list_url,
         page=current_page,
@@ -249,7 +316,19 @@ def _render_mailbox_page(
             page=current_page,
         ),
     )
-    return render_template(template_name, **context)
+    return _revalidated_mailbox_response(
+        make_response(render_template(template_name, **context)),
+        etag,
+    )
+
+
+def _revalidated_mailbox_response(response, etag):
+    """Let the browser keep a mailbox page but revalidate it on every navigation."""
+    # POST actions redirect straight back to list pages, so max-age would show stale rows.
+    response.headers["Cache-Control"] = "private, no-cache"
+    if etag:
+        response.set_etag(etag)
+    return response
 
 
 def _persist_compose_draft(fields, attachments=None):
@@ -373,6 +452,32 @@ def _register_mailbox_page_routes():
         main.add_url_rule(rule, endpoint=endpoint, view_func=view_func)
 
 
+def _json_response(payload):
+    """Serialize a JSON API payload, using orjson when it is installed."""
+    # Live-list polls carry the rendered row markup, the largest string this app serializes.
+    if orjson is None:
+        return jsonify(payload)
+    return Response(orjson.dumps(payload), mimetype="application/json")
+
+
+def _cached_list_rows_html(cache_key):
+    """Return recently rendered list rows for this key, refreshing their LRU position."""
+    with LIST_ROWS_HTML_CACHE_LOCK:
+        cached = LIST_ROWS_HTML_CACHE.pop(cache_key, None)
+        if cached is not None:
+            LIST_ROWS_HTML_CACHE[cache_key] = cached
+        return cached
+
+
+def _store_list_rows_html(cache_key, rows_html):
+    """Remember rendered list rows, evicting the least recently used entries."""
+    with LIST_ROWS_HTML_CACHE_LOCK:
+        LIST_ROWS_HTML_CACHE.pop(cache_key, None)
+        LIST_ROWS_HTML_CACHE[cache_key] = rows_html
+        while len(LIST_ROWS_HTML_CACHE) > LIST_ROWS_HTML_CACHE_MAX_ITEMS:
+            LIST_ROWS_HTML_CACHE.pop(next(iter(LIST_ROWS_HTML_CACHE)), None)
+
+
 @main.route("/api/list-emails")
 def list_emails_api():
     """JSON endpoint polled by the live mailbox to fetch updated email rows, pagination, and fingerprint data."""
@@ -404,26 +509,39 @@ def list_emails_api():
         page_size=MAILBOX_PAGE_SIZE,
         total_count=total_count,
     )
-    rows_html = render_template(
-        "_mailbox_list_content.html",
-        emails=emails,
-        current_list_url=pagination["current_url"],
-        empty_message=empty_message,
-        pagination=pagination,
-    )
-    return jsonify(
+    fingerprint = _emails_fingerprint(emails, total_count=total_count, page=current_page)
+    # The poller echoes its last fingerprint; an unchanged fingerprint means the rows and
+    # page are unchanged. The canonical list URL rides along in a header so the poller can
+    # still correct the address bar without a body.
+    if request.if_none_match.contains(fingerprint):
+        response = Response(status=304)
+        response.set_etag(fingerprint)
+        response.headers["X-Current-List-Url"] = pagination["current_url"]
+        return response
+    # The fingerprint is what the live list itself uses to decide whether rows changed;
+    # the URL and empty message cover the remaining inputs of the partial.
+    cache_key = (list_view, pagination["current_url"], empty_message, fingerprint)
+    rows_html = _cached_list_rows_html(cache_key)
+    if rows_html is None:
+        rows_html = render_template(
+            "_mailbox_list_content.html",
+            emails=emails,
+            current_list_url=pagination["current_url"],
+            empty_message=empty_message,
+            pagination=pagination,
+        )
+        _store_list_rows_html(cache_key, rows_html)
+    response = _json_response(
         {
             "html": rows_html,
-            "fingerprint": _emails_fingerprint(
-                emails,
-                total_count=total_count,
-                page=current_page,
-            ),
+            "fingerprint": fingerprint,
             "count": len(emails),
             "page": current_page,
             "current_list_url": pagination["current_url"],
         }
     )
+    response.set_etag(fingerprint)
+    return response
 
 
 @main.route("/api/email/<int:id>/ai/analyze", methods=["POST"])
@@ -481,15 +599,12 @@ def sync_from_gmail():
         return
     # This hook covers the ordinary page-load case, while pages that already poll or
     # run their own async work are skipped so we do not pile duplicate sync pressure on the backend.
-    if request.endpoint in {
-        "main.about",
-        "main.compose",
-        "main.email",
-        "main.list_emails_api",
-        "main.ai_task_status",
-    }:
+    if request.endpoint in PAGE_LOAD_SYNC_SKIPPED_ENDPOINTS:
         return
-    trigger_background_sync(max_results=30)
+    # Most page loads land inside the sync interval; check it here so they skip the
+    # trigger's lock attempt and rate-limit log entry entirely.
+    if background_sync_due():
+        trigger_background_sync(max_results=30)
 
 
 @main.route("/")
@@ -514,12 +629,17 @@ def email(id):
         refreshed = sync_message_by_external_id(external_id)
         if refreshed:
             email_data = fetch_email_by_id(id) or email_data
-    # Opening a normal inbox email marks it read both locally and at the provider.
-    if email_data.get("type") not in NON_MAIN_TYPES and not bool(email_data.get("is_archived")):
+    # Opening an unread inbox email marks it read both locally and at the provider;
+    # re-opening an already-read email writes nothing.
+    if (
+        not email_data.get("is_read")
+        and email_data.get("type") not in NON_MAIN_TYPES
+        and not bool(email_data.get("is_archived"))
+    ):
         if external_id:
             _set_message_read_state_async(external_id, read=True)
         mark_read(id, True)
-        email_data = fetch_email_by_id(id) or email_data
+        # mark_read only flips is_read, so patch the cached copy instead of re-reading the row.
         email_data["is_read"] = True
 
     if email_data.get("body_html"):
@@ -539,13 +659,14 @@ def email(id):
         task = _start_analysis_task(id, force=False)
         ai_analysis_task_id = task["id"]
 
-    thread_emails = fetch_thread_emails(email_data.get("thread_id"))
-    if email_data.get("type") not in NON_MAIN_TYPES and not bool(email_data.get("is_archived")):
-        thread_emails = [
-            item
-            for item in thread_emails
-            if item.get("type") not in NON_MAIN_TYPES and not bool(item.get("is_archived"))
-        ]
+    # Inbox emails only show their live mailbox siblings; SQL drops sent/draft/archived rows.
+    thread_emails = fetch_thread_emails(
+        email_data.get("thread_id"),
+        main_only=(
+            email_data.get("type") not in NON_MAIN_TYPES
+            and not bool(email_data.get("is_archived"))
+        ),
+    )
     next_url = _safe_next_url(request.args.get("next"))
 
     return render_template(
@@ -610,9 +731,12 @@ def bulk_email_action():
         return redirect(next_url)
 
     emails_by_id = {
-        email_data["id"]: email_data for email_data in fetch_emails_by_ids(email_ids)
+        email_data["id"]: email_data for email_data in fetch_email_states_by_ids(email_ids)
     }
 
+    # Rows without a provider copy (or whose provider update failed) get one local UPDATE at the end.
+    local_read_state_ids = []
+
     # Process each selected row on its own so one failure does not block the rest.
     for email_id in email_ids:
         email_data = emails_by_id.get(email_id)
@@ -649,7 +773,9 @@ def bulk_email_action():
             target_read_state = action == "mark-read"
             if bool(email_data.get("is_read")) == target_read_state:
                 continue
-            _set_read_state_with_fallback(email_id, email_data, target_read_state)
+            if external_id and set_message_read_state(external_id, read=target_read_state):
+                continue
+            local_read_state_ids.append(email_id)
             continue
 
         if action == "set-type":
@@ -659,6 +785,8 @@ def bulk_email_action():
             if is_archived:
                 set_email_archived(email_id, archived=False)
 
+    if local_read_state_ids:
+        mark_read_many(local_read_state_ids, read=action == "mark-read")
     return redirect(next_url)
 
 
@@ -712,17 +840,17 @@ def send_reply(id):
         return "Email not found", 404
 
     to_value, cc_value, reply_text = _collect_reply_fields(email_data)
-    attachments = _collect_attachment_payloads()
     if reply_text:
         update_draft(id, reply_text)
         sent_id = None
         if email_data.get("external_id"):
+            # Uploads are only read into memory when a provider send will actually carry them.
             sent_id = send_reply_message(
                 email_data,
                 reply_text,
                 to_value,
                 cc_value,
-                attachments=attachments,
+                attachments=_collect_attachment_payloads(),
             )
         if not sent_id:
             create_reply_email(id, reply_text, to_value, cc_value)
@@ -814,6 +942,9 @@ def compose_autosave():
 def compose_send():
     """Send the composed email via Gmail, clean up the associated draft, and redirect to the Sent tab."""
     fields = _collect_compose_fields()
+    # Reject before reading uploads or downloading draft attachments that would be discarded.
+    if not fields["to"]:
+        abort(400)
     attachments = _collect_attachment_payloads()
     # Reattach files that already exist on the provider draft or local sent message before sending.
     # Rehydrate existing draft attachments before sending the final message.
@@ -824,8 +955,6 @@ def compose_send():
         external_id = (draft_email or {}).get("external_id")
         if external_id:
             attachments = fetch_message_attachments(external_id) + attachments
-    if not fields["to"]:
-        abort(400)
 
     # Try the provider send first; the local fallback keeps the app usable offline.
     sent_external_id = send_compose_message(
@@ -10,6 +10,8 @@ CREATE TABLE IF NOT EXISTS email_messages ( -- Primary message table (one row pe
   thread_id TEXT,                               -- conversation/thread identifier
   title TEXT NOT NULL,                      -- subject line
   sender TEXT NOT NULL,                      -- single sender address
+  recipients_to TEXT,                        -- comma-joined TO addresses (mirrors email_recipients)
+  recipients_cc TEXT,                        -- comma-joined CC addresses (mirrors email_recipients)
   body TEXT,
   body_html TEXT,
   type TEXT NOT NULL DEFAULT 'read-only'
@@ -60,7 +62,7 @@ ON email_messages(type, is_archived, received_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_email_messages_thread_received -- Speeds thread view lookups.
 ON email_messages(thread_id, received_at ASC, id ASC);
 
-CREATE INDEX IF NOT EXISTS idx_email_recipients_email_type_order -- Speeds recipient aggregation subqueries.
+CREATE INDEX IF NOT EXISTS idx_email_recipients_email_type_order -- Speeds recipient rewrites and backfill lookups.
 ON email_recipients(email_id, recipient_type, id);
 
 -- Seed messages
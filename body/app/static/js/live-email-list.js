@@ -40,19 +40,37 @@
     return `/api/list-emails?${params.toString()}`;
   };
 
+  const syncListUrl = (listUrl) => { // Keep the address bar on the server's canonical list URL.
+    if (typeof listUrl !== "string" || !listUrl) {
+      return;
+    }
+    const currentLocation = `${window.location.pathname}${window.location.search}`;
+    if (listUrl !== currentLocation) {
+      window.history.replaceState(null, "", listUrl);
+    }
+  };
+
   const refreshList = async () => { // Pull fresh rows and patch DOM only when data changed.
     if (inFlight) { // Skip if previous poll is still pending.
       return;
     }
     inFlight = true;
     try {
+      const headers = {
+        Accept: "application/json", // API returns JSON payload with rendered HTML.
+      };
+      if (lastFingerprint) {
+        headers["If-None-Match"] = `"${lastFingerprint}"`; // Let the server answer 304 when rows are unchanged.
+      }
       const response = await fetch(buildUrl(), {
         method: "GET",
-        headers: {
-          Accept: "application/json", // API returns JSON payload with rendered HTML.
-        },
+        headers,
         cache: "no-store", // Always request fresh server state.
       });
+      if (response.status === 304) { // Rows and page are unchanged; only the URL may need fixing.
+        syncListUrl(response.headers.get("X-Current-List-Url"));
+        return;
+      }
       if (!response.ok) { // Ignore transient HTTP failures; next poll will retry.
         return;
       }
@@ -64,12 +82,7 @@
         currentPage = Number(payload.page);
         pageRoot.dataset.page = String(currentPage);
       }
-      if (typeof payload.current_list_url === "string" && payload.current_list_url) {
-        const currentLocation = `${window.location.pathname}${window.location.search}`;
-        if (payload.current_list_url !== currentLocation) {
-          window.history.replaceState(null, "", payload.current_list_url);
-        }
-      }
+      syncListUrl(payload.current_list_url);
       if (payload.fingerprint && payload.fingerprint === lastFingerprint) { // Skip DOM write when content is unchanged.
         return;
       }
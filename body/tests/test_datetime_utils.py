@@ -0,0 +1,30 @@
+import unittest
+from datetime import datetime
+
+from app.datetime_utils import format_known_datetime, parse_known_datetime
+
+
+class DatetimeUtilsTests(unittest.TestCase):
+    def test_parse_known_datetime_accepts_stored_formats(self):
+        self.assertEqual(
+            parse_known_datetime("2026-01-10 22:58:07"),
+            datetime(2026, 1, 10, 22, 58, 7),
+        )
+        self.assertEqual(parse_known_datetime("2026-01-10 22:58"), datetime(2026, 1, 10, 22, 58))
+        self.assertEqual(parse_known_datetime(" 2026-01-10 "), datetime(2026, 1, 10))
+        self.assertEqual(parse_known_datetime("2026-1-5"), datetime(2026, 1, 5))
+
+    def test_parse_known_datetime_rejects_unknown_or_invalid_values(self):
+        for value in (None, "", "2026-13-01", "2026-01-10T22:58:00", "yesterday"):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_known_datetime(value))
+
+    def test_format_known_datetime_uses_display_format_and_falls_back_to_text(self):
+        self.assertEqual(format_known_datetime("2026-01-10 09:05:00"), "10/01/2026 09:05")
+        self.assertEqual(format_known_datetime("2026-01-10", "%Y-%m"), "2026-01")
+        self.assertEqual(format_known_datetime(" not a date "), "not a date")
+        self.assertEqual(format_known_datetime(None), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from app import db
+
+
+class DbSessionPoolTests(unittest.TestCase):
+    def _fresh_db_path(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        db_path = str(Path(temp_dir.name) / "app.sqlite")
+        db.init_db(db_path=db_path)
+        self.addCleanup(db.close_db_connections, db_path)
+        return db_path
+
+    def test_sessions_reuse_pooled_connection_with_pragmas_applied(self):
+        db_path = self._fresh_db_path()
+
+        with db.db_session(db_path) as conn:
+            first_conn = conn
+        with db.db_session(db_path) as conn:
+            second_conn = conn
+            foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+
+        self.assertIs(first_conn, second_conn)
+        self.assertEqual(foreign_keys, 1)
+
+    def test_failed_session_rolls_back_and_connection_stays_usable(self):
+        db_path = self._fresh_db_path()
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            with db.db_session(db_path) as conn:
+                conn.execute(
+                    "INSERT INTO app_settings (key, value) VALUES ('pool_test', 'pending')"
+                )
+                conn.execute("INSERT INTO app_settings (key, value) VALUES ('pool_test', 'dup')")
+
+        self.assertIsNone(db.get_app_setting("pool_test", db_path=db_path))
+        db.set_app_setting("pool_test", "saved", db_path=db_path)
+        self.assertEqual(db.get_app_setting("pool_test", db_path=db_path), "saved")
+
+    def test_nested_session_on_same_thread_joins_the_outer_transaction(self):
+        db_path = self._fresh_db_path()
+
+        with db.db_session(db_path) as outer:
+            outer.execute("INSERT INTO app_settings (key, value) VALUES ('nested_outer', 'a')")
+            with db.db_session(db_path) as inner:
+                inner_conn = inner
+                inner.execute("INSERT INTO app_settings (key, value) VALUES ('nested_inner', 'b')")
+            still_open = outer.in_transaction
+
+        self.assertIs(inner_conn, outer)
+        self.assertTrue(still_open)
+        self.assertEqual(db.get_app_setting("nested_outer", db_path=db_path), "a")
+        self.assertEqual(db.get_app_setting("nested_inner", db_path=db_path), "b")
+
+    def test_read_session_is_query_only_and_sees_committed_writes(self):
+        db_path = self._fresh_db_path()
+        db.set_app_setting("pool_test", "first", db_path=db_path)
+
+        with db.read_session(db_path) as conn:
+            row = conn.execute(
+                "SELECT value FROM app_settings WHERE key = 'pool_test'"
+            ).fetchone()
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM app_settings")
+        db.set_app_setting("pool_test", "second", db_path=db_path)
+        with db.read_session(db_path) as conn:
+            latest = conn.execute(
+                "SELECT value FROM app_settings WHERE key = 'pool_test'"
+            ).fetchone()
+
+        self.assertEqual(row["value"], "first")
+        self.assertEqual(latest["value"], "second")
+
+    def test_cached_reads_return_copies_and_refresh_after_writes(self):
+        db_path = self._fresh_db_path()
+        email_id = db.fetch_thread_emails("thread-1", db_path=db_path)[0]["id"]
+
+        first = db.fetch_email_by_id(email_id, db_path=db_path)
+        first["title"] = "mutated by caller"
+        cached = db.fetch_email_by_id(email_id, db_path=db_path)
+        db.mark_read(email_id, read=not cached["is_read"], db_path=db_path)
+        refreshed = db.fetch_email_by_id(email_id, db_path=db_path)
+
+        self.assertEqual(cached["title"], "Meeting follow-up")
+        self.assertEqual(refreshed["is_read"], not cached["is_read"])
+
+        generation = db.READ_CACHE.generation
+        db.mark_read(email_id, read=refreshed["is_read"], db_path=db_path)
+        db.mark_read_many([email_id], read=refreshed["is_read"], db_path=db_path)
+        self.assertEqual(db.READ_CACHE.generation, generation)
+
+
+if __name__ == "__main__":
+    unittest.main()
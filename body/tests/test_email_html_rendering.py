@@ -19,7 +19,7 @@ class EmailHtmlRenderingTests(unittest.TestCase):
             "status": "running",
         }
 
-        app = create_app()
+        app = create_app({"TESTING": True})
         client = app.test_client()
 
         response = client.get("/api/ai-task/task-123")
@@ -70,7 +70,7 @@ class EmailHtmlRenderingTests(unittest.TestCase):
             "draft": "",
         }
 
-        app = create_app()
+        app = create_app({"TESTING": True})
         client = app.test_client()
 
         response = client.get("/email/123")
@@ -0,0 +1,247 @@
+import base64
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from app import db
+from app.gmail_service import _batch_get_with_failures, _extract_message_content, sync_recent_emails
+
+
+def _urlsafe(data):
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+class _FakeRequest:
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class _FakeRateLimitError(Exception):
+    def __init__(self):
+        super().__init__("HttpError 429: rateLimitExceeded")
+        self.resp = SimpleNamespace(status=429)
+
+
+class _FakeBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batch_calls += 1
+        for request_id, request in self.requests:
+            if self.service.rate_limited.get(request_id, 0) > 0:
+                self.service.rate_limited[request_id] -= 1
+                self.callback(request_id, None, _FakeRateLimitError())
+            elif request.result is None:
+                self.callback(request_id, None, RuntimeError("not found"))
+            else:
+                self.callback(request_id, request.result, None)
+
+
+class _FakeHistory:
+    def __init__(self, service):
+        self.service = service
+
+    def list(self, userId, startHistoryId, **_kwargs):
+        self.service.history_starts.append(startHistoryId)
+        if self.service.changed_ids is None:
+            raise RuntimeError("history cursor expired")
+        changes = [{"message": {"id": message_id}} for message_id in self.service.changed_ids]
+        return _FakeRequest(
+            {"historyId": self.service.history_id, "history": [{"labelsRemoved": changes}]}
+        )
+
+
+class _FakeGmailService:
+    def __init__(self, messages):
+        self.messages_by_id = {message["id"]: message for message in messages}
+        self.batch_calls = 0
+        self.formats = {}
+        self.history_id = "100"
+        self.history_starts = []
+        self.changed_ids = None
+        self.rate_limited = {}
+
+    def users(self):
+        return self
+
+    def getProfile(self, userId):
+        return _FakeRequest({"historyId": self.history_id})
+
+    def history(self):
+        return _FakeHistory(self)
+
+    def messages(self):
+        return self
+
+    def list(self, **_kwargs):
+        listed = [{"id": message_id} for message_id in self.messages_by_id]
+        return _FakeRequest({"messages": [*listed, {"id": "missing"}]})
+
+    def get(self, userId, id, format, **_kwargs):
+        self.formats[id] = format
+        message = self.messages_by_id.get(id)
+        if message is not None and format == "metadata":
+            message = {**message, "payload": {"headers": message["payload"]["headers"]}}
+        return _FakeRequest(message)
+
+    def new_batch_http_request(self, callback):
+        return _FakeBatch(self, callback)
+
+
+def _gmail_message(message_id, subject):
+    return {
+        "id": message_id,
+        "threadId": f"thread-{message_id}",
+        "labelIds": ["INBOX", "UNREAD"],
+        "internalDate": "1767258000000",
+        "payload": {
+            "mimeType": "text/plain",
+            "headers": [
+                {"name": "Subject", "value": subject},
+                {"name": "From", "value": "sender@example.com"},
+                {"name": "To", "value": "you@example.com"},
+            ],
+            "body": {"data": _urlsafe(b"Hello there")},
+        },
+    }
+
+
+class GmailMessageParsingTests(unittest.TestCase):
+    def _fresh_sync_setup(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        db_path = str(Path(temp_dir.name) / "app.sqlite")
+        db.init_db(db_path=db_path)
+        service = _FakeGmailService([_gmail_message("g-1", "First"), _gmail_message("g-2", "Second")])
+        for patcher in (
+            mock.patch("app.gmail_service._get_service", return_value=service),
+            mock.patch("app.gmail_service.log_exception"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return db_path, service
+
+    def test_inline_cid_images_become_standard_base64_data_uris(self):
+        image_bytes = bytes(range(256)) * 2
+        payload = {
+            "mimeType": "multipart/related",
+            "parts": [
+                {
+                    "mimeType": "text/html",
+                    "body": {"data": _urlsafe(b'<p>Logo <img src="cid:logo@mail"></p>')},
+                },
+                {
+                    "mimeType": "image/png",
+                    "headers": [{"name": "Content-ID", "value": "<logo@mail>"}],
+                    "body": {"data": _urlsafe(image_bytes)},
+                },
+            ],
+        }
+
+        _, html_body = _extract_message_content(payload)
+
+        expected_uri = "data:image/png;base64," + base64.b64encode(image_bytes).decode("ascii")
+        self.assertIn(expected_uri, html_body)
+        self.assertNotIn("cid:logo@mail", html_body)
+
+    def test_batch_get_retries_rate_limited_items_and_reports_leftovers(self):
+        service = _FakeGmailService([_gmail_message("g-1", "First"), _gmail_message("g-2", "Second")])
+        service.rate_limited = {"g-1": 1, "g-2": 5}
+
+        with mock.patch("app.gmail_service.log_exception"), mock.patch(
+            "app.gmail_service.GMAIL_BATCH_RETRY_DELAY_SECONDS", 0
+        ):
+            results, failed_ids = _batch_get_with_failures(
+                service,
+                ["g-1", "g-2", "missing"],
+                lambda message_id: service.get("me", message_id, "full"),
+                action="test_fetch",
+                id_field="external_id",
+                details="",
+            )
+
+        self.assertEqual(set(results), {"g-1"})
+        self.assertEqual(failed_ids, ["g-2"])
+        self.assertEqual(service.batch_calls, 3)
+
+    def test_sync_recent_emails_batches_page_and_refreshes_known_rows_from_metadata(self):
+        db_path, service = self._fresh_sync_setup()
+
+        synced = sync_recent_emails(db_path=db_path, max_results=10)
+        first_formats = dict(service.formats)
+        service.messages_by_id["g-2"]["labelIds"] = []
+        resynced = sync_recent_emails(db_path=db_path, max_results=10)
+
+        row = db.fetch_thread_emails("thread-g-2", db_path=db_path)[0]
+        self.assertEqual((synced, resynced), (2, 2))
+        self.assertEqual(service.batch_calls, 2)
+        self.assertEqual(first_formats["g-2"], "full")
+        self.assertEqual(service.formats["g-2"], "metadata")
+        self.assertEqual(row["title"], "Second")
+        self.assertEqual(row["body"], "Hello there")
+        self.assertEqual(row["recipients"], "you@example.com")
+        self.assertTrue(row["is_read"])
+        self.assertEqual(service.history_starts, ["100"])
+
+    def test_sync_recent_emails_uses_history_delta_once_cursor_is_stored(self):
+        db_path, service = self._fresh_sync_setup()
+
+        sync_recent_emails(db_path=db_path, max_results=10)
+        service.formats.clear()
+        service.messages_by_id["g-2"]["labelIds"] = []
+        service.changed_ids = ["g-2", "g-2"]
+        service.history_id = "105"
+        synced = sync_recent_emails(db_path=db_path, max_results=10)
+
+        row = db.fetch_thread_emails("thread-g-2", db_path=db_path)[0]
+        self.assertEqual(synced, 1)
+        self.assertEqual(service.formats, {"g-2": "metadata"})
+        self.assertTrue(row["is_read"])
+        self.assertEqual(db.get_app_setting("gmail_history_id", db_path=db_path), "105")
+
+    def test_sync_recent_emails_keeps_cursor_until_rate_limited_changes_are_fetched(self):
+        db_path, service = self._fresh_sync_setup()
+
+        with mock.patch("app.gmail_service.GMAIL_BATCH_RETRY_DELAY_SECONDS", 0):
+            sync_recent_emails(db_path=db_path, max_results=10)
+            service.messages_by_id["g-2"]["labelIds"] = []
+            service.changed_ids = ["g-2"]
+            service.history_id = "105"
+            service.rate_limited = {"g-2": 3}
+            failed_sync = sync_recent_emails(db_path=db_path, max_results=10)
+            stalled_cursor = db.get_app_setting("gmail_history_id", db_path=db_path)
+            retried_sync = sync_recent_emails(db_path=db_path, max_results=10)
+
+        self.assertEqual((failed_sync, retried_sync), (0, 1))
+        self.assertEqual(stalled_cursor, "100")
+        self.assertEqual(service.history_starts, ["100", "100"])
+        self.assertTrue(db.fetch_thread_emails("thread-g-2", db_path=db_path)[0]["is_read"])
+        self.assertEqual(db.get_app_setting("gmail_history_id", db_path=db_path), "105")
+
+    def test_sync_recent_emails_lists_instead_when_history_exceeds_budget(self):
+        db_path, service = self._fresh_sync_setup()
+
+        sync_recent_emails(db_path=db_path, max_results=10)
+        service.changed_ids = ["g-1", "g-2"]
+        service.history_id = "105"
+        service.formats.clear()
+        synced = sync_recent_emails(db_path=db_path, max_results=1)
+
+        self.assertEqual(synced, 1)
+        self.assertEqual(list(service.formats), ["g-1"])
+        self.assertEqual(db.get_app_setting("gmail_history_id", db_path=db_path), "105")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from unittest import mock
+
+from app import create_app, db, routes
+
+
+class MailboxPageCachingTests(unittest.TestCase):
+    @mock.patch("app.routes.trigger_background_sync")
+    @mock.patch("app.routes._fetch_live_list_emails", return_value=([], "Nothing here.", 0, 1))
+    def test_mailbox_page_revalidates_until_the_database_changes(
+        self,
+        _mock_fetch_emails,
+        _mock_background_sync,
+    ):
+        app = create_app({"TESTING": True})
+        client = app.test_client()
+
+        first = client.get("/readonly")
+        etag = first.headers.get("ETag")
+        repeat = client.get("/readonly", headers={"If-None-Match": etag})
+        db.READ_CACHE.invalidate()
+        changed = client.get("/readonly", headers={"If-None-Match": etag})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["Cache-Control"], "private, no-cache")
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.get_data(), b"")
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers.get("ETag"), etag)
+
+    @mock.patch("app.routes.trigger_background_sync")
+    @mock.patch("app.routes._fetch_live_list_emails")
+    def test_list_api_reuses_rendered_rows_until_the_fingerprint_changes(
+        self,
+        mock_fetch_emails,
+        _mock_background_sync,
+    ):
+        email = {
+            "id": 7,
+            "title": "Status",
+            "type": "read-only",
+            "priority": 1,
+            "is_read": False,
+            "is_archived": False,
+            "date": "2026-01-02 10:00:00",
+        }
+        mock_fetch_emails.return_value = ([email], "", 1, 1)
+        app = create_app({"TESTING": True})
+        client = app.test_client()
+        routes.LIST_ROWS_HTML_CACHE.clear()
+        url = "/api/list-emails?view=readonly&sync=0&next=/readonly"
+
+        with mock.patch("app.routes.render_template", wraps=routes.render_template) as render:
+            first = client.get(url).get_json()
+            repeat = client.get(url).get_json()
+            unchanged = client.get(url, headers={"If-None-Match": f'"{first["fingerprint"]}"'})
+            mock_fetch_emails.return_value = ([{**email, "is_read": True}], "", 1, 1)
+            changed = client.get(url).get_json()
+
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(repeat, first)
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(unchanged.headers["X-Current-List-Url"], first["current_list_url"])
+        self.assertNotEqual(changed["fingerprint"], first["fingerprint"])
+
+
+if __name__ == "__main__":
+    unittest.main()
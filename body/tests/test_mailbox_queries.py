@@ -130,6 +130,163 @@ class MailboxQueryTests(unittest.TestCase):
 
         self.assertEqual(recipient_matches, 1)
         self.assertEqual([row["title"] for row in body_matches], ["Weekend dinner"])
+        self.assertEqual(db.count_mailbox_emails(search_query="WEEKEND", db_path=db_path), 1)
+        self.assertEqual(db.count_mailbox_emails(search_query="Manager@Work", db_path=db_path), 1)
+
+    def test_mailbox_search_index_follows_updates_and_deletes(self):
+        db_path = self._fresh_db_path()
+        self._insert_email(
+            db_path,
+            external_id="msg-edit",
+            title="Quarterly report",
+            sender="finance@work.com",
+            recipients="you@example.com",
+            body="Numbers attached.",
+        )
+        self._insert_email(
+            db_path,
+            external_id="msg-edit",
+            title="Quarterly summary",
+            sender="finance@work.com",
+            recipients="board@example.com",
+            body="Numbers attached.",
+        )
+
+        self.assertTrue(db._search_index_ready(db_path))
+        self.assertEqual(db.count_mailbox_emails(search_query="report", db_path=db_path), 0)
+        self.assertEqual(db.count_mailbox_emails(search_query="SUMMARY", db_path=db_path), 1)
+        self.assertEqual(db.count_mailbox_emails(search_query="board@", db_path=db_path), 1)
+        self.assertEqual(db.count_mailbox_emails(search_query='"quarterly', db_path=db_path), 0)
+        self.assertEqual(db.count_mailbox_emails(search_query="q", db_path=db_path), 1)
+
+        with db.db_session(db_path) as conn:
+            conn.execute("DELETE FROM email_messages")
+        self.assertEqual(db.count_mailbox_emails(search_query="summary", db_path=db_path), 0)
+
+    def test_fetch_emails_aggregate_recipients_in_insertion_order(self):
+        db_path = self._fresh_db_path()
+        self._insert_email(
+            db_path,
+            external_id="msg-team",
+            title="Standup notes",
+            sender="lead@work.com",
+            recipients="zoe@work.com, adam@work.com",
+            cc="mia@work.com, ben@work.com",
+        )
+        self._insert_email(
+            db_path,
+            external_id="msg-solo",
+            title="No recipients",
+            sender="noreply@work.com",
+            recipients="",
+        )
+
+        rows = db.fetch_thread_emails("thread-msg-team", db_path=db_path)
+        solo_rows = db.fetch_thread_emails("thread-msg-solo", db_path=db_path)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["recipients"], "zoe@work.com, adam@work.com")
+        self.assertEqual(rows[0]["cc"], "mia@work.com, ben@work.com")
+        self.assertEqual(db.fetch_email_by_id(rows[0]["id"], db_path=db_path)["cc"], rows[0]["cc"])
+        self.assertIsNone(solo_rows[0]["recipients"])
+
+    def test_fetch_thread_emails_main_only_skips_sent_drafts_and_archived(self):
+        db_path = self._fresh_db_path()
+        for external_id, email_type in (("inbox", "read-only"), ("reply", "sent"), ("wip", "draft")):
+            db.upsert_email_from_provider(
+                {
+                    "external_id": external_id,
+                    "thread_id": "thread-shared",
+                    "title": external_id,
+                    "type": email_type,
+                },
+                db_path=db_path,
+            )
+
+        full_thread = db.fetch_thread_emails("thread-shared", db_path=db_path)
+        main_thread = db.fetch_thread_emails("thread-shared", main_only=True, db_path=db_path)
+        db.set_email_archived(main_thread[0]["id"], archived=True, db_path=db_path)
+
+        self.assertEqual(len(full_thread), 3)
+        self.assertEqual([row["title"] for row in main_thread], ["inbox"])
+        self.assertEqual(db.fetch_thread_emails("thread-shared", main_only=True, db_path=db_path), [])
+
+    def test_init_db_backfills_recipient_columns_from_recipient_rows(self):
+        db_path = self._fresh_db_path()
+        self._insert_email(
+            db_path,
+            external_id="msg-legacy",
+            title="Legacy row",
+            sender="old@example.com",
+            recipients="zoe@work.com, adam@work.com",
+            cc="mia@work.com",
+        )
+        with db.db_session(db_path) as conn:
+            conn.execute("UPDATE email_messages SET recipients_to = NULL, recipients_cc = NULL")
+
+        db.init_db(db_path=db_path)
+        row = db.fetch_thread_emails("thread-msg-legacy", db_path=db_path)[0]
+
+        self.assertEqual(row["recipients"], "zoe@work.com, adam@work.com")
+        self.assertEqual(row["cc"], "mia@work.com")
+
+    def test_fetch_email_states_by_ids_keeps_order_and_skips_bodies(self):
+        db_path = self._fresh_db_path()
+        self._insert_email(
+            db_path,
+            external_id="msg-first",
+            title="First",
+            sender="a@example.com",
+            recipients="you@example.com",
+            body="Long body text",
+        )
+        self._insert_email(
+            db_path,
+            external_id="msg-second",
+            title="Second",
+            sender="b@example.com",
+            recipients="you@example.com",
+            is_read=True,
+        )
+        ids = db.fetch_mailbox_ids(db_path=db_path)
+
+        states = db.fetch_email_states_by_ids([ids[1], "bad", ids[0], ids[1]], db_path=db_path)
+        full_rows = db.fetch_emails_by_ids([ids[1], ids[0]], db_path=db_path)
+
+        self.assertEqual([row["id"] for row in states], [ids[1], ids[0]])
+        self.assertNotIn("body", states[0])
+        self.assertEqual(
+            {row["external_id"]: row["is_read"] for row in states},
+            {"msg-first": False, "msg-second": True},
+        )
+        self.assertEqual([row["id"] for row in full_rows], [ids[1], ids[0]])
+        self.assertIn("recipients", full_rows[0])
+
+        db.mark_read_many([ids[0], ids[1], "bad"], read=True, db_path=db_path)
+        self.assertTrue(
+            all(row["is_read"] for row in db.fetch_email_states_by_ids(ids, db_path=db_path))
+        )
+
+    def test_upsert_emails_from_provider_writes_batch_and_keeps_latest_recipients(self):
+        db_path = self._fresh_db_path()
+
+        email_ids = db.upsert_emails_from_provider(
+            [
+                {"external_id": "msg-a", "title": "A", "recipients": "old@example.com"},
+                {"external_id": "msg-b", "title": "B", "recipients": "b@example.com"},
+                {"external_id": "msg-a", "title": "A v2", "recipients": "new@example.com"},
+            ],
+            db_path=db_path,
+        )
+        rows = db.fetch_emails_by_ids(email_ids, db_path=db_path)
+
+        self.assertEqual(email_ids[0], email_ids[2])
+        self.assertEqual(
+            [(row["title"], row["recipients"]) for row in rows],
+            [("A v2", "new@example.com"), ("B", "b@example.com")],
+        )
+        with self.assertRaises(ValueError):
+            db.upsert_emails_from_provider([{"title": "No ids"}], db_path=db_path)
 
     def test_build_mailbox_pagination_clamps_and_preserves_query_params(self):
         pagination = mailbox.build_mailbox_pagination(
@@ -24,18 +24,26 @@ def _email_with_ai_fields():
     }
 
 
-class _FakeResponse:
-    def __init__(self, payload):
-        self._payload = payload
+def _response_bytes(payload):
+    return json.dumps(payload).encode("utf-8")
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
+class _FakeStreamResponse:
+    def __init__(self, pieces):
+        self.lines = [
+            _response_bytes({"message": {"content": piece}, "done": False}) + b"\n"
+            for piece in pieces
+        ]
+        self.lines_read = 0
+        self.will_close = False
+
+    def __iter__(self):
+        for line in self.lines:
+            self.lines_read += 1
+            yield line
 
     def read(self):
-        return json.dumps(self._payload).encode("utf-8")
+        return b""
 
 
 class OllamaLatencyControlTests(unittest.TestCase):
@@ -70,10 +78,10 @@ class OllamaLatencyControlTests(unittest.TestCase):
     def test_call_ollama_includes_keep_alive_hint(self):
         captured = {}
 
-        def _fake_urlopen(request_obj, timeout=0):
+        def _fake_http_request(url, data=None, timeout=None):
             captured["timeout"] = timeout
-            captured["payload"] = json.loads(request_obj.data.decode("utf-8"))
-            return _FakeResponse({"message": {"content": "ok"}})
+            captured["payload"] = json.loads(data.decode("utf-8"))
+            return _response_bytes({"message": {"content": "ok"}})
 
         with mock.patch("app.ollama_client._api_url_candidates", return_value=["http://127.0.0.1:11434/api/chat"]), mock.patch(
             "app.ollama_client._endpoint_allowed",
@@ -92,8 +100,8 @@ class OllamaLatencyControlTests(unittest.TestCase):
             "app.ollama_client._keep_alive_value",
             return_value="15m",
         ), mock.patch(
-            "app.ollama_client.urllib.request.urlopen",
-            side_effect=_fake_urlopen,
+            "app.ollama_client._ollama_http_request",
+            side_effect=_fake_http_request,
         ):
             result = ollama_client._call_ollama(
                 task="summarize",
@@ -111,9 +119,9 @@ class OllamaLatencyControlTests(unittest.TestCase):
     def test_call_ollama_uses_model_task_for_model_selection(self):
         captured = {}
 
-        def _fake_urlopen(request_obj, timeout=0):
-            captured["payload"] = json.loads(request_obj.data.decode("utf-8"))
-            return _FakeResponse({"message": {"content": "ok"}})
+        def _fake_http_request(url, data=None, timeout=None):
+            captured["payload"] = json.loads(data.decode("utf-8"))
+            return _response_bytes({"message": {"content": "ok"}})
 
         with mock.patch(
             "app.ollama_client._api_url_candidates",
@@ -138,8 +146,8 @@ class OllamaLatencyControlTests(unittest.TestCase):
             "app.ollama_client._keep_alive_value",
             return_value="15m",
         ), mock.patch(
-            "app.ollama_client.urllib.request.urlopen",
-            side_effect=_fake_urlopen,
+            "app.ollama_client._ollama_http_request",
+            side_effect=_fake_http_request,
         ):
             result = ollama_client._call_ollama(
                 task="draft",
@@ -156,6 +164,103 @@ class OllamaLatencyControlTests(unittest.TestCase):
         )
         self.assertEqual(captured["payload"]["model"], "qwen2.5:7b-instruct")
 
+    def test_call_ollama_reuses_cached_response_for_identical_greedy_payloads(self):
+        calls = []
+
+        def _fake_http_request(url, data=None, timeout=None):
+            calls.append(json.loads(data.decode("utf-8")))
+            return _response_bytes({"message": {"content": f"reply-{len(calls)}"}})
+
+        with mock.patch.dict(ollama_client.CHAT_RESPONSE_CACHE, clear=True), mock.patch(
+            "app.ollama_client._api_url_candidates",
+            return_value=["http://127.0.0.1:11434/api/chat"],
+        ), mock.patch(
+            "app.ollama_client._endpoint_allowed",
+            return_value=True,
+        ), mock.patch(
+            "app.ollama_client._resolve_model_selection",
+            return_value={
+                "requested_model": "qwen2.5:7b-instruct",
+                "resolved_model": "qwen2.5:7b-instruct",
+                "available_models": ("qwen2.5:7b-instruct",),
+                "substituted": False,
+                "reason": "",
+                "strict": False,
+            },
+        ), mock.patch(
+            "app.ollama_client._ollama_http_request",
+            side_effect=_fake_http_request,
+        ):
+            messages = [{"role": "user", "content": "Classify this."}]
+            first = ollama_client._call_ollama(task="classify", messages=messages, temperature=0.0)
+            repeat = ollama_client._call_ollama(task="classify", messages=messages, temperature=0.0)
+            sampled = ollama_client._call_ollama(task="classify", messages=messages, temperature=0.2)
+
+        self.assertEqual((first, repeat, sampled), ("reply-1", "reply-1", "reply-2"))
+        self.assertEqual(len(calls), 2)
+
+    def test_stream_json_content_stops_once_first_object_closes(self):
+        response = _FakeStreamResponse(['Here: {"note": "a } in text"', ', "nested": {"x": 1}', "}", " trailing", " tokens"])
+        connection = mock.Mock()
+
+        with mock.patch("app.ollama_client._ollama_open", return_value=(connection, response)):
+            content, complete = ollama_client._ollama_stream_json_content(
+                "http://127.0.0.1:11434/api/chat",
+                data=b"{}",
+            )
+
+        self.assertTrue(complete)
+        self.assertEqual(content, 'Here: {"note": "a } in text", "nested": {"x": 1}}')
+        self.assertEqual(json.loads(ollama_client._extract_json_block(content))["nested"], {"x": 1})
+        self.assertEqual(response.lines_read, 3)
+        connection.close.assert_called_once_with()
+
+    def test_call_ollama_does_not_cache_a_stream_that_ended_early(self):
+        responses = [
+            _FakeStreamResponse(['{"label": "urg']),
+            _FakeStreamResponse(['{"label": "urgent"}']),
+        ]
+        opened = []
+
+        def _fake_open(url, data=None, timeout=None):
+            opened.append(url)
+            return mock.Mock(), responses[len(opened) - 1]
+
+        with mock.patch.dict(ollama_client.CHAT_RESPONSE_CACHE, clear=True), mock.patch(
+            "app.ollama_client._api_url_candidates",
+            return_value=["http://127.0.0.1:11434/api/chat"],
+        ), mock.patch(
+            "app.ollama_client._endpoint_allowed",
+            return_value=True,
+        ), mock.patch(
+            "app.ollama_client._resolve_model_selection",
+            return_value={
+                "requested_model": "qwen2.5:7b-instruct",
+                "resolved_model": "qwen2.5:7b-instruct",
+                "available_models": ("qwen2.5:7b-instruct",),
+                "substituted": False,
+                "reason": "",
+                "strict": False,
+            },
+        ), mock.patch(
+            "app.ollama_client._ollama_open",
+            side_effect=_fake_open,
+        ):
+            messages = [{"role": "user", "content": "Classify this."}]
+            partial = ollama_client._call_ollama(
+                task="classify", messages=messages, temperature=0.0, stop_at_json=True
+            )
+            complete = ollama_client._call_ollama(
+                task="classify", messages=messages, temperature=0.0, stop_at_json=True
+            )
+            cached = ollama_client._call_ollama(
+                task="classify", messages=messages, temperature=0.0, stop_at_json=True
+            )
+
+        self.assertEqual(partial, '{"label": "urg')
+        self.assertEqual((complete, cached), ('{"label": "urgent"}', '{"label": "urgent"}'))
+        self.assertEqual(len(opened), 2)
+
     def test_classify_model_defaults_to_global_model_when_no_override_is_set(self):
         with mock.patch.dict(
             os.environ,
@@ -219,9 +324,9 @@ class OllamaLatencyControlTests(unittest.TestCase):
     def test_call_ollama_logs_model_substitution_when_requested_model_missing(self):
         captured = {}
 
-        def _fake_urlopen(request_obj, timeout=0):
-            captured["payload"] = json.loads(request_obj.data.decode("utf-8"))
-            return _FakeResponse({"message": {"content": "ok"}})
+        def _fake_http_request(url, data=None, timeout=None):
+            captured["payload"] = json.loads(data.decode("utf-8"))
+            return _response_bytes({"message": {"content": "ok"}})
 
         with mock.patch.dict(
             os.environ,
@@ -245,8 +350,8 @@ class OllamaLatencyControlTests(unittest.TestCase):
             "app.ollama_client._keep_alive_value",
             return_value="15m",
         ), mock.patch(
-            "app.ollama_client.urllib.request.urlopen",
-            side_effect=_fake_urlopen,
+            "app.ollama_client._ollama_http_request",
+            side_effect=_fake_http_request,
         ), mock.patch(
             "app.ollama_client._log_action",
         ) as mock_log:
@@ -291,8 +396,8 @@ class OllamaLatencyControlTests(unittest.TestCase):
         ), mock.patch(
             "app.ollama_client._log_action",
         ) as mock_log, mock.patch(
-            "app.ollama_client.urllib.request.urlopen",
-        ) as mock_urlopen:
+            "app.ollama_client._ollama_http_request",
+        ) as mock_http_request:
             result = ollama_client._call_ollama(
                 task="classify",
                 messages=[{"role": "user", "content": "Classify this."}],
@@ -300,7 +405,7 @@ class OllamaLatencyControlTests(unittest.TestCase):
             )
 
         self.assertIsNone(result)
-        mock_urlopen.assert_not_called()
+        mock_http_request.assert_not_called()
         error_logs = [
             call.kwargs["detail"]
             for call in mock_log.call_args_list
@@ -0,0 +1,34 @@
+import unittest
+
+from app import create_app
+from app.routes import _safe_next_url
+
+
+class SafeRedirectTests(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app({"TESTING": True})
+
+    def test_safe_next_url_keeps_local_list_paths(self):
+        with self.app.test_request_context("/"):
+            self.assertEqual(_safe_next_url("/junk?sort=date_asc&page=2"), "/junk?sort=date_asc&page=2")
+            self.assertEqual(_safe_next_url(" /readonly "), "/readonly")
+            self.assertEqual(_safe_next_url("/sent?page=3#row-4"), "/sent?page=3")
+
+    def test_safe_next_url_rejects_off_site_and_detail_targets(self):
+        with self.app.test_request_context("/"):
+            fallback = _safe_next_url(None)
+            for value in (
+                "https://evil.example/",
+                "//evil.example/",
+                "/\\evil.example/",
+                "/\t/evil.example/",
+                "relative/path",
+                "/email/12",
+            ):
+                with self.subTest(value=value):
+                    self.assertEqual(_safe_next_url(value), fallback)
+            self.assertEqual(fallback, "/allemails")
+
+
+if __name__ == "__main__":
+    unittest.main()